@@ -0,0 +1,183 @@
+import { describe, it, expect, vi, beforeEach } from 'vitest'
+import { render, screen, waitFor, act } from '@testing-library/react'
+import { http, HttpResponse } from 'msw'
+import { server } from './test/mocks/server'
+import App from './App'
+import { createMockAppointmentWithPatient, createMockConsultation } from './test/fixtures'
+
+// Signed-in doctor with a complete profile, so MainApp lands on the appointments tab
+let mockUser = { id: 'test-user-id', email: 'doctor@example.com' }
+vi.mock('./contexts/AuthContext', () => ({
+  AuthProvider: ({ children }: { children: React.ReactNode }) => children,
+  useAuth: () => ({
+    user: mockUser,
+    loading: false,
+    signIn: vi.fn(),
+    signOut: vi.fn(),
+    isPatient: false,
+    userRole: 'doctor',
+    doctorProfile: { id: 'doc-123', name: 'Dr Jane Smith', specialty: 'general' },
+    isAdmin: false,
+    pendingVerification: null,
+    clearPendingVerification: vi.fn(),
+  }),
+}))
+
+vi.mock('./hooks/useConsultations', () => ({
+  useConsultations: () => ({ saveConsultation: vi.fn() }),
+}))
+vi.mock('./hooks/useAppointments', () => ({
+  useAppointments: () => ({ createAppointment: vi.fn() }),
+}))
+vi.mock('./hooks/useMessages', () => ({
+  useMessages: () => ({ unreadCount: 0 }),
+}))
+vi.mock('./hooks/usePatientDoctors', () => ({
+  usePatientDoctors: () => ({ myPatients: [] }),
+}))
+
+// Capture the handler App passes to the appointments tab so the test can submit directly
+let appointmentsTabProps: Record<string, any> = {}
+vi.mock('./components/AppointmentsTab', () => ({
+  AppointmentsTab: (props: Record<string, any>) => {
+    appointmentsTabProps = props
+    return <div>Appointments tab</div>
+  },
+}))
+vi.mock('./components/ProgressScreen', () => ({
+  ProgressScreen: () => <div>Analysing...</div>,
+}))
+vi.mock('./components/ReportScreenV2', () => ({
+  ReportScreenV2: ({ appointmentContext }: { appointmentContext?: { patient?: { name?: string } } }) => (
+    <div>Report for {appointmentContext?.patient?.name}</div>
+  ),
+}))
+vi.mock('./components/TabNavigation', () => ({ TabNavigation: () => null }))
+vi.mock('./components/LocationSelector', () => ({ LocationSelector: () => null }))
+vi.mock('./components/BranchIndicator', () => ({ BranchIndicator: () => null }))
+vi.mock('./components/doctor-portal/MedicalForm', () => ({ MedicalForm: () => null }))
+
+vi.mock('./lib/geolocation', () => ({
+  getUserIp: vi.fn(() => Promise.resolve(undefined)),
+}))
+
+vi.mock('./lib/supabase', () => ({
+  supabase: {
+    from: vi.fn(() => ({
+      update: vi.fn(() => ({
+        eq: vi.fn(() => Promise.resolve({ error: null })),
+      })),
+    })),
+  },
+}))
+
+// The analysis stream stays open until the test finishes it
+let streamOptions: any = null
+let finishStream: () => void = () => {}
+const mockFetchEventSource = vi.fn((_url: string, options: any) => {
+  streamOptions = options
+  return new Promise<void>(resolve => {
+    finishStream = resolve
+  })
+})
+vi.mock('@microsoft/fetch-event-source', () => ({
+  fetchEventSource: (url: string, options: any) => mockFetchEventSource(url, options),
+}))
+
+describe('App', () => {
+  beforeEach(() => {
+    vi.clearAllMocks()
+    appointmentsTabProps = {}
+    streamOptions = null
+    mockUser = { id: 'test-user-id', email: 'doctor@example.com' }
+  })
+
+  // Runs one analysis of a consultation through to the end of its stream
+  const analyseToCompletion = async (consultationId: string) => {
+    const appointment = createMockAppointmentWithPatient()
+    const consultation = createMockConsultation({ id: consultationId, summary_data: null })
+    const callsBefore = mockFetchEventSource.mock.calls.length
+
+    let analysis: Promise<void> = Promise.resolve()
+    act(() => {
+      analysis = appointmentsTabProps.onAnalyzeConsultation(appointment, consultation)
+    })
+    await waitFor(() => expect(mockFetchEventSource).toHaveBeenCalledTimes(callsBefore + 1))
+
+    await act(async () => {
+      streamOptions.onmessage({ event: 'complete', data: JSON.stringify({ diagnoses: [] }) })
+      finishStream()
+      await analysis
+    })
+  }
+
+  describe('saved consultation summaries', () => {
+    const countSummarizeRequests = () => {
+      const summarize = vi.fn(() => HttpResponse.json({ summary: 'Cached summary' }))
+      server.use(http.post('http://localhost:8000/api/summarize', summarize))
+      return summarize
+    }
+
+    it('reuses the summary when the same consultation is analysed again', async () => {
+      const summarize = countSummarizeRequests()
+      render(<App />)
+      await screen.findByText('Appointments tab')
+
+      await analyseToCompletion('cons-reuse')
+      await analyseToCompletion('cons-reuse')
+
+      expect(summarize).toHaveBeenCalledTimes(1)
+    })
+
+    it('does not reuse summaries after the signed-in user changes', async () => {
+      const summarize = countSummarizeRequests()
+      const { rerender } = render(<App />)
+      await screen.findByText('Appointments tab')
+
+      await analyseToCompletion('cons-switch')
+      mockUser = { id: 'other-user-id', email: 'other@example.com' }
+      rerender(<App />)
+      await analyseToCompletion('cons-switch')
+
+      expect(summarize).toHaveBeenCalledTimes(2)
+    })
+  })
+
+  describe('analysing a past consultation', () => {
+    it('keeps the running analysis selection when a second one is submitted', async () => {
+      render(<App />)
+      await screen.findByText('Appointments tab')
+
+      const aliceAppointment = createMockAppointmentWithPatient({
+        id: 'apt-alice',
+        patient: { id: 'pat-alice', name: 'Alice Brown' },
+      })
+      const bobAppointment = createMockAppointmentWithPatient({
+        id: 'apt-bob',
+        patient: { id: 'pat-bob', name: 'Bob Green' },
+      })
+
+      await act(async () => {
+        appointmentsTabProps.onAnalyzeConsultation(aliceAppointment, createMockConsultation({ id: 'cons-alice' }))
+        appointmentsTabProps.onAnalyzeConsultation(bobAppointment, createMockConsultation({ id: 'cons-bob' }))
+      })
+
+      await waitFor(() => expect(mockFetchEventSource).toHaveBeenCalledTimes(1))
+
+      act(() => {
+        streamOptions.onmessage({
+          event: 'diagnoses',
+          data: JSON.stringify({ diagnoses: [{ diagnosis: 'Migraine' }], drugs_pending: [] }),
+        })
+      })
+
+      expect(await screen.findByText('Report for Alice Brown')).toBeInTheDocument()
+      expect(screen.queryByText('Report for Bob Green')).not.toBeInTheDocument()
+
+      await act(async () => {
+        streamOptions.onmessage({ event: 'complete', data: JSON.stringify({ diagnoses: [] }) })
+        finishStream()
+      })
+    })
+  })
+})
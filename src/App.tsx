@@ -15,15 +15,22 @@ import { usePatientDoctors } from './hooks/usePatientDoctors';
 import { ErrorBoundary } from './components/ErrorBoundary';
 import { PatientDashboard } from './components/patient-portal/PatientDashboard';
 import { getPatientAge } from './utils/dateHelpers';
+import { getUserIp } from './lib/geolocation';
+import { debugLog } from './utils/logger';
+import { fetchWithRetry } from './utils/retry';
+import { UpdateBatcher } from './utils/updateBatcher';
 
 // Helper function for timestamped logging
 const timestamp = () => new Date().toISOString();
 
 // Dynamic imports for code splitting - these components load on demand
 const InputScreen = lazy(() => import('./components/InputScreen').then(m => ({ default: m.InputScreen })));
-const ProgressScreen = lazy(() => import('./components/ProgressScreen').then(m => ({ default: m.ProgressScreen })));
+// Analysis result screens are preloaded from the input screen (see effect in MainApp)
+const loadProgressScreen = () => import('./components/ProgressScreen');
+const loadReportScreen = () => import('./components/ReportScreenV2');
+const ProgressScreen = lazy(() => loadProgressScreen().then(m => ({ default: m.ProgressScreen })));
 const AnalysisComplete = lazy(() => import('./components/AnalysisComplete').then(m => ({ default: m.AnalysisComplete })));
-const ReportScreen = lazy(() => import('./components/ReportScreenV2').then(m => ({ default: m.ReportScreenV2 })));
+const ReportScreen = lazy(() => loadReportScreen().then(m => ({ default: m.ReportScreenV2 })));
 const InvalidInputScreen = lazy(() => import('./components/InvalidInputScreen').then(m => ({ default: m.InvalidInputScreen })));
 const FeedbackDashboard = lazy(() => import('./components/FeedbackDashboard').then(m => ({ default: m.FeedbackDashboard })));
 const AppointmentsTab = lazy(() => import('./components/AppointmentsTab').then(m => ({ default: m.AppointmentsTab })));
@@ -67,6 +74,86 @@ const API_URL = (() => {
   return url;
 })();
 
+// A successful health check is trusted for this long, so back-to-back analyses
+// don't each pay an extra round trip before streaming starts
+const HEALTH_CHECK_TTL_MS = 30 * 1000;
+let lastHealthyAt = 0;
+
+/**
+ * Throws if the backend is unreachable or unhealthy.
+ * Successful checks are cached for HEALTH_CHECK_TTL_MS.
+ */
+async function ensureBackendHealthy(): Promise<void> {
+  if (Date.now() - lastHealthyAt < HEALTH_CHECK_TTL_MS) {
+    return;
+  }
+
+  const healthResponse = await fetch(`${API_URL}/api/health`, {
+    method: 'GET',
+    signal: AbortSignal.timeout(5000) // 5 second timeout
+  });
+
+  if (!healthResponse.ok) {
+    throw new Error('Backend health check failed');
+  }
+
+  const healthData = await healthResponse.json();
+  if (healthData.status !== 'healthy') {
+    throw new Error('Backend is not healthy');
+  }
+
+  lastHealthyAt = Date.now();
+}
+
+// /api/summarize results for saved consultations, keyed by consultation id.
+// The summary is written back to Supabase in the background, but the
+// consultation objects held by the lists aren't refreshed, so re-analysing
+// the same consultation would otherwise pay for a second LLM summary.
+// Entries hold patient data, so they are bounded, expire, and are cleared
+// whenever the signed-in user changes (see MainApp).
+const SAVED_SUMMARY_TTL_MS = 30 * 60 * 1000;
+const MAX_SAVED_SUMMARIES = 20;
+const savedConsultationSummaries = new Map<string, { transcript: string; result: any; savedAt: number }>();
+
+/**
+ * Summary from an earlier analysis of this consultation, or null if there is
+ * none, it has expired, or the transcript has changed since.
+ */
+function getSavedSummary(consultationId: string, transcript: string): any | null {
+  const entry = savedConsultationSummaries.get(consultationId);
+  if (!entry) return null;
+  if (entry.transcript !== transcript || Date.now() - entry.savedAt > SAVED_SUMMARY_TTL_MS) {
+    savedConsultationSummaries.delete(consultationId);
+    return null;
+  }
+  return entry.result;
+}
+
+function rememberSavedSummary(consultationId: string, transcript: string, result: any): void {
+  // Re-insert so Map order tracks recency, then evict the oldest entries
+  savedConsultationSummaries.delete(consultationId);
+  savedConsultationSummaries.set(consultationId, { transcript, result, savedAt: Date.now() });
+  while (savedConsultationSummaries.size > MAX_SAVED_SUMMARIES) {
+    const oldest = savedConsultationSummaries.keys().next().value;
+    if (oldest === undefined) break;
+    savedConsultationSummaries.delete(oldest);
+  }
+}
+
+// Drug details received during this session, keyed by drug name. BNF
+// information is patient-independent, so a drug that appeared in an earlier
+// analysis can be shown immediately while the backend re-sends it.
+const sessionDrugDetails = new Map<string, any>();
+
+/**
+ * Drop a resolved drug from the pending list.
+ * Returns the same array when the drug isn't pending (repeat or late
+ * drug_update events) so React can skip the re-render.
+ */
+function removePendingDrug(pending: string[], drugName: string): string[] {
+  return pending.includes(drugName) ? pending.filter(d => d !== drugName) : pending;
+}
+
 interface StreamEvent {
   type: string;
   data: any;
@@ -130,8 +217,8 @@ function MainApp() {
   const isProfileIncomplete = !doctorProfile || !hasProperName || !hasSpecialty;
   const needsProfileSetup = userRole === 'doctor' && isProfileIncomplete && !pendingVerification;
 
-  // Debug logging to understand needsProfileSetup state
-  console.log('🔍 needsProfileSetup check:', {
+  // Debug logging to understand needsProfileSetup state (runs on every render)
+  debugLog('🔍 needsProfileSetup check:', {
     userRole,
     doctorProfile: doctorProfile ? { name: doctorProfile.name, specialty: doctorProfile.specialty } : null,
     hasProperName,
@@ -144,6 +231,9 @@ function MainApp() {
   // Track previous needsProfileSetup state to detect completion
   const prevNeedsProfileSetup = useRef(needsProfileSetup);
 
+  // Set while an analysis is starting or streaming, so double-submits don't open a second stream
+  const analysisInFlightRef = useRef(false);
+
   // Redirect to profile page if doctor profile needs setup
   // This runs on mount and whenever profile changes or user tries to navigate away
   useEffect(() => {
@@ -164,6 +254,21 @@ function MainApp() {
     prevNeedsProfileSetup.current = needsProfileSetup;
   }, [needsProfileSetup]);
 
+  // MainApp stays mounted across sign-out, so drop cached consultation summaries
+  // whenever the signed-in user changes - the next user mustn't inherit them
+  useEffect(() => {
+    savedConsultationSummaries.clear();
+  }, [user?.id]);
+
+  // Warm the progress/report chunks while the doctor is recording, so starting
+  // an analysis doesn't wait on a code-split download (errors surface on render)
+  useEffect(() => {
+    if (currentScreen === 'input') {
+      loadProgressScreen().catch(() => {});
+      loadReportScreen().catch(() => {});
+    }
+  }, [currentScreen]);
+
   // Show loading state while checking auth
   if (loading) {
     return (
@@ -280,6 +385,52 @@ function MainApp() {
     );
   }
 
+  // Report-building SSE events, shared by the live and saved-consultation flows
+  const handleDiagnosesEvent = (data: any) => {
+    debugLog(`[${timestamp()}] ✅ Diagnoses ready:`, data.diagnoses?.length || 0, 'diagnoses');
+    debugLog(`[${timestamp()}] ⏳ Drugs pending:`, data.drugs_pending?.length || 0, 'drugs');
+    // Diagnoses available - show report immediately!
+    setAnalysisResult((prev: any) => ({ ...prev, diagnoses: data.diagnoses }));
+    // Track pending drugs for loading state
+    const pending = Array.from(new Set<string>(data.drugs_pending || []));
+    setDrugsPending(pending);
+
+    // Show details already seen this session instead of a loading state
+    const known = pending.filter(drugName => sessionDrugDetails.has(drugName));
+    if (known.length > 0) {
+      setDrugDetails(prev => {
+        const next = { ...prev };
+        for (const drugName of known) {
+          if (!next[drugName]) next[drugName] = sessionDrugDetails.get(drugName);
+        }
+        return next;
+      });
+    }
+    setCurrentScreen('report');
+  };
+
+  const handleDrugUpdateEvent = (data: any) => {
+    // Individual drug details arrived
+    const source = data.source || 'unknown';
+    debugLog(`[${timestamp()}] 💊 Drug ${data.drug_name}: ${data.status} (source: ${source})`);
+
+    // Remove from pending list regardless of status
+    setDrugsPending(prev => removePendingDrug(prev, data.drug_name));
+
+    if (data.status === 'complete' && data.details) {
+      // Log if LLM was used
+      if (source === 'llm') {
+        debugLog(`[${timestamp()}]   AI-generated drug information for ${data.drug_name}`);
+      }
+
+      sessionDrugDetails.set(data.drug_name, data.details);
+      setDrugDetails(prev => ({
+        ...prev,
+        [data.drug_name]: data.details
+      }));
+    }
+  };
+
   const handleAnalyze = async (
     consultation: string,
     patientDetails: PatientDetails,
@@ -294,6 +445,13 @@ function MainApp() {
       return;
     }
 
+    // Ignore repeat submissions while an analysis is already running
+    if (analysisInFlightRef.current) {
+      console.warn('Analysis already in progress - ignoring duplicate request');
+      return;
+    }
+    analysisInFlightRef.current = true;
+
     setAnalysisResult(null); // Clear previous results
     setCurrentPatientDetails(patientDetails); // Store patient details for report
     setStreamEvents([]); // Clear previous stream events
@@ -306,24 +464,16 @@ function MainApp() {
     setTranscriptionLanguage(detectedLanguageParam || '');
 
     try {
+      // Get user's IP address for geolocation - not needed when the region is
+      // overridden, since the backend uses location_override instead of the IP.
+      // Started before the health check so the two round trips overlap.
+      const userIpPromise = locationOverride ? Promise.resolve(undefined) : getUserIp();
+
       // Check if backend is available first
       console.log('Checking backend availability...');
       console.log('API URL:', API_URL);
       try {
-        const healthResponse = await fetch(`${API_URL}/api/health`, {
-          method: 'GET',
-          signal: AbortSignal.timeout(5000) // 5 second timeout
-        });
-
-        if (!healthResponse.ok) {
-          throw new Error('Backend health check failed');
-        }
-
-        const healthData = await healthResponse.json();
-        if (healthData.status !== 'healthy') {
-          throw new Error('Backend is not healthy');
-        }
-
+        await ensureBackendHealthy();
         console.log('✅ Backend is available');
       } catch (healthError) {
         console.error('Backend unavailable:', healthError);
@@ -336,16 +486,7 @@ function MainApp() {
         return; // Don't proceed with analysis
       }
 
-      // Get user's IP address for geolocation
-      let userIp = undefined;
-      try {
-        const ipResponse = await fetch('https://api.ipify.org?format=json');
-        const ipData = await ipResponse.json();
-        userIp = ipData.ip;
-        console.log('Detected user IP:', userIp);
-      } catch (error) {
-        console.warn('Could not detect IP address, backend will auto-detect:', error);
-      }
+      const userIp = await userIpPromise;
 
       // Use fetchEventSource for proper SSE handling (no buffering)
       // This library handles POST requests with SSE correctly
@@ -355,6 +496,10 @@ function MainApp() {
       let hasError = false;
       let isComplete = false;
       const abortController = new AbortController();
+      // Events arrive in bursts; render them at most every 50ms
+      const streamEventBatcher = new UpdateBatcher<StreamEvent>(events =>
+        setStreamEvents(prev => prev.concat(events))
+      );
 
       await fetchEventSource(`${API_URL}/api/analyze-stream`, {
         method: 'POST',
@@ -390,51 +535,28 @@ function MainApp() {
           const eventType = ev.event;
           try {
             const data = JSON.parse(ev.data);
-            console.log(`[${timestamp()}] SSE Event: ${eventType}`, data);
+            debugLog(`[${timestamp()}] SSE Event: ${eventType}`, data);
 
             // Add event to state for real-time display
-            setStreamEvents((prev: StreamEvent[]) => [...prev, {
+            streamEventBatcher.push({
               type: eventType,
               data: data,
               timestamp: Date.now()
-            }]);
+            });
 
             // Handle different event types
             if (eventType === 'location') {
-              console.log(`[${timestamp()}] 📍 Location detected:`, data.country);
+              debugLog(`[${timestamp()}] 📍 Location detected:`, data.country);
             } else if (eventType === 'guideline_search') {
-              console.log(`[${timestamp()}] 🔍 Searching:`, data.source);
+              debugLog(`[${timestamp()}] 🔍 Searching:`, data.source);
             } else if (eventType === 'diagnoses') {
-              // Diagnoses available - show report immediately!
-              console.log(`[${timestamp()}] ✅ Diagnoses ready:`, data.diagnoses.length, 'diagnoses');
-              console.log(`[${timestamp()}] ⏳ Drugs pending:`, data.drugs_pending?.length || 0, 'drugs');
-              setAnalysisResult((prev: any) => ({ ...prev, diagnoses: data.diagnoses }));
-              // Track pending drugs for loading state
-              setDrugsPending(data.drugs_pending || []);
-              setCurrentScreen('report');
+              handleDiagnosesEvent(data);
             } else if (eventType === 'drug_update') {
-              // Individual drug details arrived
-              const source = data.source || 'unknown';
-              console.log(`[${timestamp()}] 💊 Drug ${data.drug_name}: ${data.status} (source: ${source})`);
-
-              // Remove from pending list regardless of status
-              setDrugsPending(prev => prev.filter(d => d !== data.drug_name));
-
-              if (data.status === 'complete' && data.details) {
-                // Log if LLM was used
-                if (source === 'llm') {
-                  console.log(`[${timestamp()}]   AI-generated drug information for ${data.drug_name}`);
-                }
-
-                setDrugDetails(prev => ({
-                  ...prev,
-                  [data.drug_name]: data.details
-                }));
-              }
+              handleDrugUpdateEvent(data);
             } else if (eventType === 'bnf_drug') {
-              console.log(`[${timestamp()}] 💊 Drug ${data.medication}: ${data.status}`);
+              debugLog(`[${timestamp()}] 💊 Drug ${data.medication}: ${data.status}`);
             } else if (eventType === 'complete') {
-              console.log(`[${timestamp()}] ✅ Analysis complete`);
+              debugLog(`[${timestamp()}] ✅ Analysis complete`);
               finalResult = data;
               isComplete = true;
               // Abort the connection since we're done
@@ -494,7 +616,7 @@ function MainApp() {
         } else {
           throw err;
         }
-      });
+      }).finally(() => streamEventBatcher.flush());
 
       // After stream completes, handle final result
       if (!hasError && finalResult) {
@@ -522,6 +644,8 @@ function MainApp() {
       console.error(`[${timestamp()}] Analysis error:`, error);
       alert(`Analysis failed: ${error instanceof Error ? error.message : 'Unknown error'}. Please check the backend is running.`);
       setCurrentScreen('input');
+    } finally {
+      analysisInFlightRef.current = false;
     }
   };
 
@@ -580,12 +704,15 @@ function MainApp() {
     currentConditions: patient.current_conditions || ''
   });
 
-  // Handler for analyzing past consultations that weren't analyzed yet
-  const handleAnalyzePastConsultation = async (appointment: AppointmentWithPatient, consultation: Consultation) => {
-    // Set up state with consultation data
-    setSelectedAppointment(appointment);
-    setSelectedPatient(appointment.patient);
-
+  // Shared implementation for analysing a saved consultation.
+  // returnScreen is where the user lands if the backend is unavailable or analysis fails.
+  // selectAppointment makes the appointment/patient current once the analysis starts.
+  const analyzeSavedConsultation = async (
+    appointment: AppointmentWithPatient,
+    consultation: Consultation,
+    returnScreen: Screen,
+    selectAppointment = false
+  ) => {
     // Build patient details from patient record
     const patientDetails = buildPatientDetails(appointment.patient);
 
@@ -597,246 +724,18 @@ function MainApp() {
       return;
     }
 
-    // Store consultation ID for updating after analysis
-    setConsultationText(textToAnalyze);
-    setConsultationTranscript(textToAnalyze);
-    setOriginalTranscript(consultation.original_transcript || '');
-    setTranscriptionLanguage(consultation.transcription_language || '');
-    setCurrentPatientDetails(patientDetails);
-
-    // Clear previous state
-    setAnalysisResult(null);
-    setStreamEvents([]);
-    setAnalysisErrors([]);
-    setDrugDetails({});
-
-    // Navigate to progress screen
-    setCurrentScreen('progress');
-
-    // Call the analyze endpoint
-    try {
-      // Check if backend is available first
-      try {
-        const healthResponse = await fetch(`${API_URL}/api/health`, {
-          method: 'GET',
-          signal: AbortSignal.timeout(5000)
-        });
-
-        if (!healthResponse.ok) {
-          throw new Error('Backend health check failed');
-        }
-      } catch (healthError) {
-        console.error('Backend unavailable:', healthError);
-        alert(
-          'Unable to connect to the Aneya backend server.\n\n' +
-          'Please ensure the API server is running.'
-        );
-        setCurrentScreen('appointments');
-        return;
-      }
-
-      // Get user's IP address for geolocation
-      let userIp = undefined;
-      try {
-        const ipResponse = await fetch('https://api.ipify.org?format=json');
-        const ipData = await ipResponse.json();
-        userIp = ipData.ip;
-      } catch (error) {
-        console.warn('Could not detect IP address:', error);
-      }
-
-      // Check if consultation needs summarization first (no summary_data)
-      let textForAnalysis = textToAnalyze;
-      if (!consultation.summary_data) {
-        console.log('Consultation needs summarization first, calling /api/summarize...');
-        setStreamEvents(prev => [...prev, {
-          type: 'summarizing',
-          data: { message: 'Summarizing consultation transcript...' },
-          timestamp: Date.now()
-        }]);
-
-        const summarizeResponse = await fetch(`${API_URL}/api/summarize`, {
-          method: 'POST',
-          headers: {
-            'Content-Type': 'application/json',
-          },
-          body: JSON.stringify({
-            transcript: textToAnalyze,
-            patient_name: patientDetails.name,
-            user_ip: userIp
-          }),
-        });
-
-        if (!summarizeResponse.ok) {
-          console.warn('Summarization failed, proceeding with raw transcript');
-        } else {
-          const summaryResult = await summarizeResponse.json();
-          console.log('Summarization complete:', summaryResult);
-
-          // Update the consultation with summary data
-          if (summaryResult.consultation_data?.summary_data) {
-            try {
-              const { supabase } = await import('./lib/supabase');
-              await supabase
-                .from('consultations')
-                .update({
-                  summary_data: summaryResult.consultation_data.summary_data,
-                  consultation_text: summaryResult.consultation_data.consultation_text || textToAnalyze,
-                  prescriptions: summaryResult.consultation_data.prescriptions || [],
-                })
-                .eq('id', consultation.id);
-              console.log('Consultation updated with summary data');
-            } catch (updateErr) {
-              console.warn('Failed to save summary data:', updateErr);
-            }
-          }
-
-          // Use the summarized text for analysis if available
-          if (summaryResult.summary) {
-            textForAnalysis = summaryResult.summary;
-            setConsultationSummary(summaryResult.summary);
-          }
-        }
-      }
-
-      // Use fetchEventSource for proper SSE handling (no buffering)
-      console.log(`[${timestamp()}] Starting SSE connection for past consultation analysis`);
-
-      let finalResult: any = null;
-      let hasError = false;
-      let isComplete = false;
-      const abortController = new AbortController();
-
-      await fetchEventSource(`${API_URL}/api/analyze-stream`, {
-        method: 'POST',
-        headers: {
-          'Content-Type': 'application/json',
-        },
-        body: JSON.stringify({
-          consultation: textForAnalysis,
-          patient_name: patientDetails.name,
-          patient_age: patientDetails.age,
-          patient_sex: patientDetails.sex,
-          patient_height: patientDetails.height,
-          patient_weight: patientDetails.weight,
-          current_medications: patientDetails.currentMedications,
-          current_conditions: patientDetails.currentConditions,
-          user_ip: userIp,
-          location_override: locationOverride || undefined
-        }),
-        signal: abortController.signal,
-        openWhenHidden: true,
-        async onopen(response) {
-          console.log(`[${timestamp()}] SSE connection opened, status: ${response.status}`);
-          if (!response.ok) {
-            const errorText = await response.text();
-            throw new Error(`Analysis failed: ${response.status} ${errorText}`);
-          }
-        },
-        onmessage(ev) {
-          const eventType = ev.event;
-          try {
-            const data = JSON.parse(ev.data);
-            console.log(`[${timestamp()}] SSE Event: ${eventType}`, data);
-
-            setStreamEvents(prev => [...prev, {
-              type: eventType,
-              data: data,
-              timestamp: Date.now()
-            }]);
-
-            if (eventType === 'diagnoses') {
-              console.log(`[${timestamp()}] ✅ Diagnoses ready:`, data.diagnoses?.length || 0, 'diagnoses');
-              setAnalysisResult((prev: any) => ({ ...prev, diagnoses: data.diagnoses }));
-              setDrugsPending(data.drugs_pending || []);
-              setCurrentScreen('report');
-            } else if (eventType === 'drug_update') {
-              const source = data.source || 'unknown';
-              console.log(`[${timestamp()}] 💊 Drug ${data.drug_name}: ${data.status} (source: ${source})`);
-              setDrugsPending(prev => prev.filter(d => d !== data.drug_name));
-              if (data.status === 'complete' && data.details) {
-                setDrugDetails(prev => ({
-                  ...prev,
-                  [data.drug_name]: data.details
-                }));
-              }
-            } else if (eventType === 'complete') {
-              console.log(`[${timestamp()}] ✅ Analysis complete`);
-              finalResult = data;
-              isComplete = true;
-              abortController.abort();
-            } else if (eventType === 'error') {
-              console.error(`[${timestamp()}] Error during analysis:`, data.message || data.error);
-              setAnalysisErrors(prev => [...prev, data.message || data.error]);
-            }
-          } catch (e) {
-            console.error(`[${timestamp()}] Error parsing event data:`, e);
-          }
-        },
-        onerror(err) {
-          if (isComplete || abortController.signal.aborted) {
-            return; // Don't retry if complete
-          }
-          console.error(`[${timestamp()}] SSE error:`, err);
-          hasError = true;
-          throw err;
-        },
-        onclose() {
-          console.log(`[${timestamp()}] SSE connection closed`);
-        }
-      }).catch((err) => {
-        if (err.name === 'AbortError' || abortController.signal.aborted) {
-          console.log(`[${timestamp()}] SSE connection aborted (expected)`);
-        } else {
-          throw err;
-        }
-      });
-
-      if (!hasError && finalResult) {
-        setAnalysisResult((prev: any) => ({ ...(prev || {}), ...finalResult }));
-
-        // Update the consultation in Supabase with the analysis results
-        try {
-          const { supabase } = await import('./lib/supabase');
-          const { error } = await supabase
-            .from('consultations')
-            .update({
-              analysis_result: finalResult,
-              diagnoses: finalResult.diagnoses || [],
-              guidelines_found: finalResult.guidelines_found || []
-            })
-            .eq('id', consultation.id);
-
-          if (error) {
-            console.error(`[${timestamp()}] Failed to update consultation with analysis:`, error);
-          } else {
-            console.log(`[${timestamp()}] ✅ Consultation updated with analysis results`);
-            // Refresh appointments to show updated data
-            setAppointmentsRefreshKey(prev => prev + 1);
-          }
-        } catch (updateError) {
-          console.error(`[${timestamp()}] Error updating consultation:`, updateError);
-        }
-      }
-    } catch (error) {
-      console.error(`[${timestamp()}] Analysis error:`, error);
-      setAnalysisErrors(prev => [...prev, String(error)]);
-      alert(`Analysis failed: ${error}`);
-      setCurrentScreen('appointments');
+    // Ignore repeat submissions while an analysis is already running
+    if (analysisInFlightRef.current) {
+      console.warn('Analysis already in progress - ignoring duplicate request');
+      return;
     }
-  };
-
-  // Handler for analyzing consultations from PatientDetailView (uses selectedPatient from state)
-  const handleAnalyzeConsultationFromPatientView = async (appointment: AppointmentWithPatient, consultation: Consultation) => {
-    // Build patient details from appointment patient data
-    const patientDetails = buildPatientDetails(appointment.patient);
+    analysisInFlightRef.current = true;
 
-    // Get the text to analyze
-    const textToAnalyze = consultation.original_transcript || consultation.consultation_text || '';
-
-    if (!textToAnalyze.trim()) {
-      alert('This consultation has no transcript to analyze.');
-      return;
+    // Only after the guard: a dropped repeat submission must not re-point the
+    // running analysis (and its later save) at a different patient
+    if (selectAppointment) {
+      setSelectedAppointment(appointment);
+      setSelectedPatient(appointment.patient);
     }
 
     // Set up state
@@ -857,35 +756,23 @@ function MainApp() {
 
     // Call the analyze endpoint
     try {
+      // Get user's IP address for geolocation, overlapping with the health check
+      const userIpPromise = getUserIp();
+
       // Check if backend is available first
       try {
-        const healthResponse = await fetch(`${API_URL}/api/health`, {
-          method: 'GET',
-          signal: AbortSignal.timeout(5000)
-        });
-
-        if (!healthResponse.ok) {
-          throw new Error('Backend health check failed');
-        }
+        await ensureBackendHealthy();
       } catch (healthError) {
         console.error('Backend unavailable:', healthError);
         alert(
           'Unable to connect to the Aneya backend server.\n\n' +
           'Please ensure the API server is running.'
         );
-        setCurrentScreen('patient-detail');
+        setCurrentScreen(returnScreen);
         return;
       }
 
-      // Get user's IP address for geolocation
-      let userIp = undefined;
-      try {
-        const ipResponse = await fetch('https://api.ipify.org?format=json');
-        const ipData = await ipResponse.json();
-        userIp = ipData.ip;
-      } catch (error) {
-        console.warn('Could not detect IP address:', error);
-      }
+      const userIp = await userIpPromise;
 
       // Check if consultation needs summarization first (no summary_data)
       let textForAnalysis = textToAnalyze;
@@ -897,57 +784,73 @@ function MainApp() {
           timestamp: Date.now()
         }]);
 
-        const summarizeResponse = await fetch(`${API_URL}/api/summarize`, {
-          method: 'POST',
-          headers: {
-            'Content-Type': 'application/json',
-          },
-          body: JSON.stringify({
-            transcript: textToAnalyze,
-            patient_name: patientDetails.name,
-            user_ip: userIp
-          }),
-        });
-
-        if (!summarizeResponse.ok) {
-          console.warn('Summarization failed, proceeding with raw transcript');
+        let summaryResult: any = getSavedSummary(consultation.id, textToAnalyze);
+
+        if (summaryResult) {
+          console.log('Reusing summary from earlier analysis of this consultation');
         } else {
-          const summaryResult = await summarizeResponse.json();
-          console.log('Summarization complete:', summaryResult);
-
-          // Update the consultation with summary data
-          if (summaryResult.consultation_data?.summary_data) {
-            try {
-              const { supabase } = await import('./lib/supabase');
-              await supabase
-                .from('consultations')
-                .update({
-                  summary_data: summaryResult.consultation_data.summary_data,
-                  consultation_text: summaryResult.consultation_data.consultation_text || textToAnalyze,
-                  prescriptions: summaryResult.consultation_data.prescriptions || [],
-                })
-                .eq('id', consultation.id);
-              console.log('Consultation updated with summary data');
-            } catch (updateErr) {
-              console.warn('Failed to save summary data:', updateErr);
+          const summarizeResponse = await fetchWithRetry(`${API_URL}/api/summarize`, {
+            method: 'POST',
+            headers: {
+              'Content-Type': 'application/json',
+            },
+            body: JSON.stringify({
+              transcript: textToAnalyze,
+              patient_name: patientDetails.name,
+              user_ip: userIp
+            }),
+          });
+
+          if (!summarizeResponse.ok) {
+            console.warn('Summarization failed, proceeding with raw transcript');
+          } else {
+            summaryResult = await summarizeResponse.json();
+            console.log('Summarization complete:', summaryResult);
+            rememberSavedSummary(consultation.id, textToAnalyze, summaryResult);
+
+            // Update the consultation with summary data (fire-and-forget).
+            // Analysis only needs the summary text, so the write runs alongside the
+            // stream instead of delaying it; the later analysis update touches other columns.
+            if (summaryResult.consultation_data?.summary_data) {
+              const consultationData = summaryResult.consultation_data;
+              void (async () => {
+                try {
+                  const { supabase } = await import('./lib/supabase');
+                  await supabase
+                    .from('consultations')
+                    .update({
+                      summary_data: consultationData.summary_data,
+                      consultation_text: consultationData.consultation_text || textToAnalyze,
+                      prescriptions: consultationData.prescriptions || [],
+                    })
+                    .eq('id', consultation.id);
+                  console.log('Consultation updated with summary data');
+                } catch (updateErr) {
+                  console.warn('Failed to save summary data:', updateErr);
+                }
+              })();
             }
           }
+        }
 
-          // Use the summarized text for analysis if available
-          if (summaryResult.summary) {
-            textForAnalysis = summaryResult.summary;
-            setConsultationSummary(summaryResult.summary);
-          }
+        // Use the summarized text for analysis if available
+        if (summaryResult?.summary) {
+          textForAnalysis = summaryResult.summary;
+          setConsultationSummary(summaryResult.summary);
         }
       }
 
       // Use fetchEventSource for proper SSE handling (no buffering)
-      console.log(`[${timestamp()}] Starting SSE connection for patient view analysis`);
+      console.log(`[${timestamp()}] Starting SSE connection for saved consultation analysis`);
 
       let finalResult: any = null;
       let hasError = false;
       let isComplete = false;
       const abortController = new AbortController();
+      // Events arrive in bursts; render them at most every 50ms
+      const streamEventBatcher = new UpdateBatcher<StreamEvent>(events =>
+        setStreamEvents(prev => prev.concat(events))
+      );
 
       await fetchEventSource(`${API_URL}/api/analyze-stream`, {
         method: 'POST',
@@ -979,31 +882,20 @@ function MainApp() {
           const eventType = ev.event;
           try {
             const data = JSON.parse(ev.data);
-            console.log(`[${timestamp()}] SSE Event: ${eventType}`, data);
+            debugLog(`[${timestamp()}] SSE Event: ${eventType}`, data);
 
-            setStreamEvents(prev => [...prev, {
+            streamEventBatcher.push({
               type: eventType,
               data: data,
               timestamp: Date.now()
-            }]);
+            });
 
             if (eventType === 'diagnoses') {
-              console.log(`[${timestamp()}] ✅ Diagnoses ready:`, data.diagnoses?.length || 0, 'diagnoses');
-              setAnalysisResult((prev: any) => ({ ...prev, diagnoses: data.diagnoses }));
-              setDrugsPending(data.drugs_pending || []);
-              setCurrentScreen('report');
+              handleDiagnosesEvent(data);
             } else if (eventType === 'drug_update') {
-              const source = data.source || 'unknown';
-              console.log(`[${timestamp()}] 💊 Drug ${data.drug_name}: ${data.status} (source: ${source})`);
-              setDrugsPending(prev => prev.filter(d => d !== data.drug_name));
-              if (data.status === 'complete' && data.details) {
-                setDrugDetails(prev => ({
-                  ...prev,
-                  [data.drug_name]: data.details
-                }));
-              }
+              handleDrugUpdateEvent(data);
             } else if (eventType === 'complete') {
-              console.log(`[${timestamp()}] ✅ Analysis complete`);
+              debugLog(`[${timestamp()}] ✅ Analysis complete`);
               finalResult = data;
               isComplete = true;
               abortController.abort();
@@ -1032,7 +924,7 @@ function MainApp() {
         } else {
           throw err;
         }
-      });
+      }).finally(() => streamEventBatcher.flush());
 
       if (!hasError && finalResult) {
         setAnalysisResult((prev: any) => ({ ...(prev || {}), ...finalResult }));
@@ -1053,6 +945,8 @@ function MainApp() {
             console.error(`[${timestamp()}] Failed to update consultation with analysis:`, error);
           } else {
             console.log(`[${timestamp()}] ✅ Consultation updated with analysis results`);
+            // Refresh appointments to show updated data
+            setAppointmentsRefreshKey(prev => prev + 1);
           }
         } catch (updateError) {
           console.error(`[${timestamp()}] Error updating consultation:`, updateError);
@@ -1062,10 +956,20 @@ function MainApp() {
       console.error(`[${timestamp()}] Analysis error:`, error);
       setAnalysisErrors(prev => [...prev, String(error)]);
       alert(`Analysis failed: ${error}`);
-      setCurrentScreen('patient-detail');
+      setCurrentScreen(returnScreen);
+    } finally {
+      analysisInFlightRef.current = false;
     }
   };
 
+  // Handler for analyzing past consultations that weren't analyzed yet
+  const handleAnalyzePastConsultation = (appointment: AppointmentWithPatient, consultation: Consultation) =>
+    analyzeSavedConsultation(appointment, consultation, 'appointments', true);
+
+  // Handler for analyzing consultations from PatientDetailView
+  const handleAnalyzeConsultationFromPatientView = (appointment: AppointmentWithPatient, consultation: Consultation) =>
+    analyzeSavedConsultation(appointment, consultation, 'patient-detail');
+
   const handleSaveConsultation = async () => {
     if (!selectedPatient || !analysisResult) {
       console.error('Missing patient or analysis result');
@@ -1074,25 +978,24 @@ function MainApp() {
 
     try {
       // Format consultation_text with both transcript and summary
-      let formattedConsultationText = '';
+      const consultationTextParts: string[] = [];
 
       if (consultationTranscript) {
-        formattedConsultationText += `Consultation Transcript:\n${consultationTranscript}`;
+        consultationTextParts.push(`Consultation Transcript:\n${consultationTranscript}`);
       }
 
       if (consultationSummary) {
-        if (formattedConsultationText) formattedConsultationText += '\n\n';
         // Handle case where consultationSummary might be an object
         const summaryText = typeof consultationSummary === 'string'
           ? consultationSummary
           : (consultationSummary as any)?.summary || JSON.stringify(consultationSummary);
-        formattedConsultationText += `Consultation Summary:\n${summaryText}`;
+        consultationTextParts.push(`Consultation Summary:\n${summaryText}`);
       }
 
       // Fallback to consultationText if neither transcript nor summary is set
-      if (!formattedConsultationText) {
-        formattedConsultationText = consultationText;
-      }
+      const formattedConsultationText = consultationTextParts.length > 0
+        ? consultationTextParts.join('\n\n')
+        : consultationText;
 
       // Extract summary_data from consultationSummary if available
       const summaryObj = consultationSummary as any;
@@ -2,6 +2,7 @@ import { useState } from 'react';
 import { AppointmentWithPatient, Consultation } from '../types/database';
 import { AppointmentStatusBadge } from './AppointmentStatusBadge';
 import { formatTime24 } from '../utils/dateHelpers';
+import { truncateText } from '../utils/textHelpers';
 
 interface AppointmentCardProps {
   appointment: AppointmentWithPatient;
@@ -25,9 +26,7 @@ export function AppointmentCard({
 
   const canStartConsultation = appointment.status === 'scheduled' || appointment.status === 'in_progress';
   const reasonDisplay = appointment.reason
-    ? appointment.reason.length > 100
-      ? appointment.reason.substring(0, 100) + '...'
-      : appointment.reason
+    ? truncateText(appointment.reason, 100)
     : 'No reason specified';
 
   const handleDownloadPdf = async () => {
@@ -6,6 +6,7 @@ import { StructuredSummaryDisplay } from './StructuredSummaryDisplay';
 import { AudioPlayer } from './AudioPlayer';
 import { AnalysisModeModal, AnalysisMode } from './AnalysisModeModal';
 import { PrescriptionModal } from './PrescriptionEditor';
+import { getConfidenceBadgeColor } from '../utils/confidenceHelpers';
 
 interface AppointmentDetailModalProps {
   isOpen: boolean;
@@ -106,19 +107,6 @@ export function AppointmentDetailModal({
     ? consultation.diagnoses[0].confidence
     : null;
 
-  const getConfidenceBadgeColor = (conf?: string) => {
-    switch (conf?.toLowerCase()) {
-      case 'high':
-        return 'bg-green-100 text-green-700 border-green-300';
-      case 'medium':
-        return 'bg-yellow-100 text-yellow-700 border-yellow-300';
-      case 'low':
-        return 'bg-red-100 text-red-700 border-red-300';
-      default:
-        return 'bg-gray-100 text-gray-700 border-gray-300';
-    }
-  };
-
   // Extract transcript and summary from consultation_text
   const getTranscriptAndSummary = () => {
     if (!consultation?.consultation_text) return { transcript: null, summary: null };
@@ -101,6 +101,14 @@ export function AppointmentsTab({ onStartConsultation, onAnalyzeConsultation, on
     options?: { force_consultation_type?: string; consultation_text_override?: string }
   ) => {
     try {
+      const consultationText = options?.consultation_text_override || consultation.consultation_text || '';
+
+      // Nothing to extract fields from - skip the LLM round trip
+      if (!consultationText.trim() && !consultation.original_transcript?.trim()) {
+        console.warn(`⚠️ Skipping form auto-fill for consultation ${consultation.id}: no text`);
+        return;
+      }
+
       console.log(`📋 Auto-filling form for consultation ${consultation.id}...`);
 
       // Get Firebase ID token for authentication
@@ -115,7 +123,7 @@ export function AppointmentsTab({ onStartConsultation, onAnalyzeConsultation, on
         appointment_id: appointment.id,
         patient_id: appointment.patient_id,
         original_transcript: consultation.original_transcript || '',
-        consultation_text: options?.consultation_text_override || consultation.consultation_text || '',
+        consultation_text: consultationText,
         patient_snapshot: consultation.patient_snapshot || {}
       };
 
@@ -173,14 +181,13 @@ export function AppointmentsTab({ onStartConsultation, onAnalyzeConsultation, on
       const apiUrl = import.meta.env.VITE_API_URL || 'https://aneya-backend-xao3xivzia-el.a.run.app';
 
       // Prepare the request body
+      const patientAge = appointment.patient ? getPatientAgeNumber(appointment.patient) : null;
       const requestBody = {
         text: consultation.consultation_text || consultation.original_transcript || '',
         original_text: consultation.original_transcript,
         patient_info: consultation.patient_snapshot || {
           patient_id: appointment.patient_id,
-          patient_age: appointment.patient && getPatientAgeNumber(appointment.patient)
-            ? `${getPatientAgeNumber(appointment.patient)} years old`
-            : 'Age unknown',
+          patient_age: patientAge ? `${patientAge} years old` : 'Age unknown',
         },
         is_from_transcription: true,
         transcription_language: consultation.transcription_language || 'en'
@@ -235,7 +242,9 @@ export function AppointmentsTab({ onStartConsultation, onAnalyzeConsultation, on
         throw updateError;
       }
 
-      // Extract form fields using the NEW summary text and preserve consultation type
+      // Only auto-fill once the new summary is saved - the endpoint writes the form
+      // server-side, so running it alongside a failed update would leave a form that
+      // doesn't match the consultation's stored summary
       console.log('📋 Extracting form fields from consultation...');
       await extractAndFillForm(appointment, consultation, apiUrl, {
         force_consultation_type: consultation.detected_consultation_type || undefined,
@@ -3,6 +3,7 @@ import { Consultation } from '../types/database';
 import { ChevronDown, ChevronUp, Trash2, Brain, FileText, Activity, Pill, Stethoscope, RefreshCw, FlaskConical } from 'lucide-react';
 import { formatDateUK, formatTime24, formatDuration } from '../utils/dateHelpers';
 import { AnalysisModeModal, AnalysisMode } from './AnalysisModeModal';
+import { getConfidenceBadgeColor } from '../utils/confidenceHelpers';
 
 interface ConsultationHistoryCardProps {
   consultation: Consultation;
@@ -77,19 +78,6 @@ export function ConsultationHistoryCard({ consultation, onDelete, onAnalyze, onR
     ? consultation.diagnoses[0].confidence
     : null;
 
-  const getConfidenceBadgeColor = (conf?: string) => {
-    switch (conf?.toLowerCase()) {
-      case 'high':
-        return 'bg-green-100 text-green-700 border-green-300';
-      case 'medium':
-        return 'bg-yellow-100 text-yellow-700 border-yellow-300';
-      case 'low':
-        return 'bg-red-100 text-red-700 border-red-300';
-      default:
-        return 'bg-gray-100 text-gray-700 border-gray-300';
-    }
-  };
-
   // Split consultation_text into transcript and summary if formatted as separate sections
   const getTranscriptAndSummary = () => {
     if (!consultation?.consultation_text) return { transcript: null, summary: null };
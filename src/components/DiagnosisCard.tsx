@@ -2,6 +2,7 @@ import { useState } from 'react';
 import { ChevronDown, ChevronUp, ExternalLink, AlertTriangle } from 'lucide-react';
 import { DrugDetailDropdown } from './DrugDetailDropdown';
 import { WarningBox } from './WarningBox';
+import { getConfidenceBadgeColor } from '../utils/confidenceHelpers';
 
 // New structure interfaces matching backend
 interface PrimaryCare {
@@ -81,19 +82,6 @@ export function DiagnosisCard({
 }: DiagnosisCardProps) {
   const [showDetails, setShowDetails] = useState(isPrimary); // Primary diagnosis expanded by default
 
-  const getConfidenceBadgeColor = (conf?: string) => {
-    switch (conf?.toLowerCase()) {
-      case 'high':
-        return 'bg-green-100 text-green-700 border-green-300';
-      case 'medium':
-        return 'bg-yellow-100 text-yellow-700 border-yellow-300';
-      case 'low':
-        return 'bg-red-100 text-red-700 border-red-300';
-      default:
-        return 'bg-gray-100 text-gray-700 border-gray-300';
-    }
-  };
-
   return (
     <div className={`bg-white rounded-[16px] aneya-shadow-card border border-aneya-soft-pink overflow-hidden ${className}`}>
       {/* Header - Always visible */}
@@ -27,15 +27,21 @@ function getSpeakerColor(speakerId: string) {
   return SPEAKER_COLORS[speakerId] || { bg: 'bg-gray-100', text: 'text-gray-700' };
 }
 
+// Numbered diarized format:
+//  1. [0.00 - 4.56] speaker_0:
+//      Good morning, how are you feeling today?
+const NUMBERED_SEGMENT_PATTERN = /^\s*\d+\.\s*\[(\d+\.?\d*)\s*-\s*(\d+\.?\d*)\]\s*(speaker_\d+):\s*\n\s+(.+)/;
+const NUMBERED_BLOCK_BOUNDARY = /(?=\s*\d+\.\s*\[)/;
+// Older line-based formats: "speaker_0: text" and "Doctor: text"
+const SPEAKER_LINE_PATTERN = /^(speaker_\d+):\s*(.+)/i;
+const ROLE_LINE_PATTERN = /^(Doctor|Patient|Nurse|Clinician):\s*(.+)/i;
+
 export function parseTranscriptText(text: string): DiarizedSegment[] {
-  // First, try parsing as numbered diarized format:
-  //  1. [0.00 - 4.56] speaker_0:
-  //      Good morning, how are you feeling today?
-  const numberedPattern = /^\s*\d+\.\s*\[(\d+\.?\d*)\s*-\s*(\d+\.?\d*)\]\s*(speaker_\d+):\s*\n\s+(.+)/;
-  const numberedBlocks = text.split(/(?=\s*\d+\.\s*\[)/);
+  // First, try parsing as numbered diarized format
+  const numberedBlocks = text.split(NUMBERED_BLOCK_BOUNDARY);
   const numberedSegments: DiarizedSegment[] = [];
   for (const block of numberedBlocks) {
-    const match = block.match(numberedPattern);
+    const match = block.match(NUMBERED_SEGMENT_PATTERN);
     if (match) {
       numberedSegments.push({
         speaker_id: match[3].toLowerCase(),
@@ -54,7 +60,7 @@ export function parseTranscriptText(text: string): DiarizedSegment[] {
   const lines = text.split('\n').filter(l => l.trim());
   return lines.map((line, idx) => {
     // Match "speaker_0: text" or "Speaker 0: text"
-    const speakerMatch = line.match(/^(speaker_\d+):\s*(.+)/i);
+    const speakerMatch = line.match(SPEAKER_LINE_PATTERN);
     if (speakerMatch) {
       return {
         speaker_id: speakerMatch[1].toLowerCase(),
@@ -65,7 +71,7 @@ export function parseTranscriptText(text: string): DiarizedSegment[] {
       };
     }
     // Match "Doctor: text" or "Patient: text" — map to speaker IDs
-    const roleMatch = line.match(/^(Doctor|Patient|Nurse|Clinician):\s*(.+)/i);
+    const roleMatch = line.match(ROLE_LINE_PATTERN);
     if (roleMatch) {
       const role = roleMatch[1].toLowerCase();
       const speakerId = role === 'doctor' || role === 'clinician' ? 'speaker_0' : 'speaker_1';
@@ -2,6 +2,25 @@ import { useState } from 'react';
 import { ChevronDown, ChevronUp, ExternalLink } from 'lucide-react';
 import { DrugDetails } from '../types/drug';
 
+// Fields shown in the expanded view; BNF and DrugBank use the same keys
+const DRUG_DETAIL_FIELDS = [
+  { key: 'dosage', label: 'Dosage' },
+  { key: 'side_effects', label: 'Side Effects' },
+  { key: 'interactions', label: 'Drug Interactions' },
+] as const;
+
+const PLACEHOLDER_VALUE = 'Not specified';
+
+// Field display component
+function FieldDisplay({ label, value }: { label: string; value: string }) {
+  return (
+    <div>
+      <h4 className="text-[14px] font-semibold text-aneya-navy mb-1">{label}</h4>
+      <p className="text-[14px] text-aneya-navy whitespace-pre-wrap">{value}</p>
+    </div>
+  );
+}
+
 interface DrugDetailDropdownProps {
   drugName: string;
   details?: DrugDetails | null; // undefined = loading, null = failed, object = loaded
@@ -27,24 +46,14 @@ export function DrugDetailDropdown({ drugName, details, onExpand }: DrugDetailDr
   const bnfData = details?.bnf_data;
   const drugbankData = details?.drugbank_data;
 
-  // Helper to get field value with fallback priority (BNF preferred for clinical info)
-  const getField = (bnfField?: string, drugbankField?: string) => {
-    const bnfValue = bnfData && bnfField && (bnfData as any)[bnfField];
-    const drugbankValue = drugbankData && drugbankField && (drugbankData as any)[drugbankField];
-
-    // Return BNF if available and not "Not specified", otherwise DrugBank
-    if (bnfValue && bnfValue !== 'Not specified') return bnfValue;
-    if (drugbankValue && drugbankValue !== 'Not specified') return drugbankValue;
-    return null;
-  };
-
-  // Field display component
-  const FieldDisplay = ({ label, value }: { label: string; value: string }) => (
-    <div>
-      <h4 className="text-[14px] font-semibold text-aneya-navy mb-1">{label}</h4>
-      <p className="text-[14px] text-aneya-navy whitespace-pre-wrap">{value}</p>
-    </div>
-  );
+  // Resolve each field once, preferring BNF (clinical info) over DrugBank
+  const fields = DRUG_DETAIL_FIELDS.flatMap(({ key, label }) => {
+    const bnfValue = bnfData?.[key];
+    const drugbankValue = drugbankData?.[key];
+    if (bnfValue && bnfValue !== PLACEHOLDER_VALUE) return [{ key, label, value: bnfValue }];
+    if (drugbankValue && drugbankValue !== PLACEHOLDER_VALUE) return [{ key, label, value: drugbankValue }];
+    return [];
+  });
 
   return (
     <div className="mb-2">
@@ -123,20 +132,10 @@ export function DrugDetailDropdown({ drugName, details, onExpand }: DrugDetailDr
                 </div>
               )}
 
-              {/* Dosage - try BNF first, then DrugBank */}
-              {getField('dosage', 'dosage') && (
-                <FieldDisplay label="Dosage" value={getField('dosage', 'dosage')!} />
-              )}
-
-              {/* Side Effects - try BNF first, then DrugBank */}
-              {getField('side_effects', 'side_effects') && (
-                <FieldDisplay label="Side Effects" value={getField('side_effects', 'side_effects')!} />
-              )}
-
-              {/* Drug Interactions - try BNF first, then DrugBank */}
-              {getField('interactions', 'interactions') && (
-                <FieldDisplay label="Drug Interactions" value={getField('interactions', 'interactions')!} />
-              )}
+              {/* Dosage, side effects and interactions - BNF first, then DrugBank */}
+              {fields.map(({ key, label, value }) => (
+                <FieldDisplay key={key} label={label} value={value} />
+              ))}
             </div>
           )}
         </div>
@@ -1,4 +1,4 @@
-import { useState, useRef, useEffect, useCallback } from 'react';
+import { useState, useRef, useEffect, useCallback, useMemo } from 'react';
 import { Download } from 'lucide-react';
 import { PrimaryButton } from './PrimaryButton';
 import { Patient, AppointmentWithPatient, ConsultationLanguage, CONSULTATION_LANGUAGES, isSarvamLanguage } from '../types/database';
@@ -12,8 +12,13 @@ import { useAuth } from '../contexts/AuthContext';
 import { MedicalForm } from './doctor-portal/MedicalForm';
 import { extractAudioChunk, shouldProcessNextChunk, extractFinalChunk, resetWebMInitSegment } from '../utils/chunkExtraction';
 import { matchSpeakersAcrossChunks } from '../utils/speakerMatching';
+import { encodePcm16Base64 } from '../utils/pcmEncoding';
+import { TranscriptBuffer } from '../utils/transcriptBuffer';
+import { fetchWithRetry } from '../utils/retry';
+import { debugLog } from '../utils/logger';
 import { supabase } from '../lib/supabase';
 import { consultationEventBus } from '../lib/consultationEventBus';
+import { getFormSchemas } from '../lib/formSchemas';
 import { useConsultationRealtime } from '../hooks/useConsultationRealtime';
 import { usePreviousAppointment } from '../hooks/usePreviousAppointment';
 import { PreviousAppointmentSidebar } from './PreviousAppointmentSidebar';
@@ -145,6 +150,13 @@ const API_URL = import.meta.env.VITE_API_URL || 'http://localhost:8000';
 const ELEVENLABS_WS_URL = 'wss://api.elevenlabs.io/v1/speech-to-text/realtime';
 const SARVAM_WS_URL = 'wss://api.sarvam.ai/speech-to-text-translate/ws';
 
+// Lowercase and strip punctuation so overlapping chunk transcripts compare equal
+const PUNCTUATION_PATTERN = /[^\w\s]/g;
+
+function normalizeSegmentText(text: string): string {
+  return text.toLowerCase().replace(PUNCTUATION_PATTERN, '').trim();
+}
+
 // Format seconds as MM:SS
 function formatTime(seconds: number): string {
   const mins = Math.floor(seconds / 60);
@@ -152,15 +164,15 @@ function formatTime(seconds: number): string {
   return `${mins.toString().padStart(2, '0')}:${secs.toString().padStart(2, '0')}`;
 }
 
-// Convert Float32Array audio samples to 16-bit PCM
-function float32ToInt16(float32Array: Float32Array): Int16Array {
-  const int16Array = new Int16Array(float32Array.length);
-  for (let i = 0; i < float32Array.length; i++) {
-    const s = Math.max(-1, Math.min(1, float32Array[i]));
-    int16Array[i] = s < 0 ? s * 0x8000 : s * 0x7fff;
-  }
-  return int16Array;
-}
+// Doctor specialty -> form schema specialty
+const SPECIALTY_TO_SCHEMA_FORMAT: Record<string, string> = {
+  'obgyn': 'obstetrics_gynecology',
+  'cardiology': 'cardiology',
+  'neurology': 'neurology',
+  'dermatology': 'dermatology',
+  'general': 'general',
+  'other': 'other',
+};
 
 // Default patient details (prefilled)
 const DEFAULT_PATIENT_DETAILS: PatientDetails = {
@@ -173,6 +185,22 @@ const DEFAULT_PATIENT_DETAILS: PatientDetails = {
   currentConditions: 'Type 2 Diabetes Mellitus, Hypertension',
 };
 
+/**
+ * Map patient details to the patient_info shape expected by /api/summarize
+ */
+function toSummarizePatientInfo(patientId: string | undefined, details: PatientDetails) {
+  return {
+    patient_id: patientId,
+    patient_age: details.age,
+    patient_name: details.name,
+    sex: details.sex,
+    height: details.height,
+    weight: details.weight,
+    current_medications: details.currentMedications,
+    current_conditions: details.currentConditions,
+  };
+}
+
 /**
  * Determine form type based on appointment type
  * Returns a form_type string or null if no form type can be determined
@@ -213,6 +241,11 @@ export function InputScreen({ onAnalyze, onSaveConsultation, onUpdateConsultatio
   } : DEFAULT_PATIENT_DETAILS;
 
   const [patientDetails, setPatientDetails] = useState<PatientDetails>(initialPatientDetails);
+  // patient_info payload for /api/summarize - rebuilt only when the patient changes
+  const summarizePatientInfo = useMemo(
+    () => toSummarizePatientInfo(preFilledPatient?.id, patientDetails),
+    [preFilledPatient?.id, patientDetails]
+  );
   const [isPatientDetailsExpanded, setIsPatientDetailsExpanded] = useState(false);
   const [isRecording, setIsRecording] = useState(false);
   const [isPaused, setIsPaused] = useState(false);
@@ -327,15 +360,15 @@ export function InputScreen({ onAnalyze, onSaveConsultation, onUpdateConsultatio
   // Debug: log diarized segments and chunk status when they update
   useEffect(() => {
     if (diarizedSegments.length > 0) {
-      console.log(`📝 Diarized segments updated: ${diarizedSegments.length} total segments`);
-      console.log('Latest segments:', diarizedSegments.slice(-3));
+      debugLog(`📝 Diarized segments updated: ${diarizedSegments.length} total segments`);
+      debugLog('Latest segments:', diarizedSegments.slice(-3));
     }
   }, [diarizedSegments.length]);
 
   useEffect(() => {
     if (chunkStatuses.length > 0) {
       const summary = chunkStatuses.map(c => `${c.index}:${c.status}`).join(', ');
-      console.log(`📊 Chunk status: [${summary}]`);
+      debugLog(`📊 Chunk status: [${summary}]`);
     }
   }, [chunkStatuses]);
 
@@ -362,25 +395,14 @@ export function InputScreen({ onAnalyze, onSaveConsultation, onUpdateConsultatio
   // Map doctor specialty to form schema specialty format
   const mapSpecialtyToSchemaFormat = (specialty: string | undefined): string | null => {
     if (!specialty) return null;
-    const mapping: Record<string, string> = {
-      'obgyn': 'obstetrics_gynecology',
-      'cardiology': 'cardiology',
-      'neurology': 'neurology',
-      'dermatology': 'dermatology',
-      'general': 'general',
-      'other': 'other',
-    };
-    return mapping[specialty] || specialty;
+    return SPECIALTY_TO_SCHEMA_FORMAT[specialty] || specialty;
   };
 
   // Fetch available forms for the doctor's specialty
   useEffect(() => {
     const fetchForms = async () => {
       try {
-        const response = await fetch(`${API_URL}/api/form-schemas`);
-        if (!response.ok) return;
-
-        const data = await response.json();
+        const data = await getFormSchemas();
         const schemaSpecialty = mapSpecialtyToSchemaFormat(doctorProfile?.specialty);
 
         // Filter for forms matching the doctor's specialty
@@ -426,9 +448,10 @@ export function InputScreen({ onAnalyze, onSaveConsultation, onUpdateConsultatio
   const audioChunksRef = useRef<Blob[]>([]);
 
   // ElevenLabs transcription state - tracks completed segments
-  const completedTurnsRef = useRef<string[]>([]); // Translated (English) segments
+  // Buffers are built once (lazy state) - this component re-renders on every partial transcript
+  const [completedTurns] = useState(() => new TranscriptBuffer()); // Translated (English) segments
   const currentTurnTranscriptRef = useRef<string>(''); // Current turn (translated)
-  const originalCompletedTurnsRef = useRef<string[]>([]); // Original language segments
+  const [originalCompletedTurns] = useState(() => new TranscriptBuffer()); // Original language segments
   const currentOriginalTurnRef = useRef<string>(''); // Current turn (original)
 
   // Check backend health on page load
@@ -586,26 +609,30 @@ export function InputScreen({ onAnalyze, onSaveConsultation, onUpdateConsultatio
 
       // Merge segments into global list (deduplicate overlaps)
       setDiarizedSegments(prev => {
-        // Filter out duplicates using time-based and text similarity
+        // Filter out duplicates using time-based and text similarity.
+        // Existing text is normalised lazily, at most once per segment.
+        const normalizedExisting = new Map<DiarizedSegment, string>();
+        const existingText = (seg: DiarizedSegment) => {
+          let text = normalizedExisting.get(seg);
+          if (text === undefined) {
+            text = normalizeSegmentText(seg.text);
+            normalizedExisting.set(seg, text);
+          }
+          return text;
+        };
+
         const newSegments = labeledSegments.filter((newSeg: any) => {
+          const newText = normalizeSegmentText(newSeg.text);
+
           // Check if this segment is too similar to any existing segment
           const isDuplicate = prev.some(existingSeg => {
-            // Same speaker within 2 seconds with similar text
-            const timeDiff = Math.abs(newSeg.start_time - existingSeg.start_time);
-            const sameOrSimilarTime = timeDiff < 2.0;
-            const sameSpeaker = newSeg.speaker_id === existingSeg.speaker_id;
-
-            // Check text similarity (normalized)
-            const normalizeText = (text: string) => text.toLowerCase().replace(/[^\w\s]/g, '').trim();
-            const newText = normalizeText(newSeg.text);
-            const existingText = normalizeText(existingSeg.text);
-
-            // Consider duplicate if same speaker, close in time, and text overlaps significantly
-            const textMatch = newText === existingText ||
-                              newText.includes(existingText) ||
-                              existingText.includes(newText);
-
-            return sameOrSimilarTime && sameSpeaker && textMatch;
+            // Same speaker within 2 seconds with similar text - cheap checks first
+            if (newSeg.speaker_id !== existingSeg.speaker_id) return false;
+            if (Math.abs(newSeg.start_time - existingSeg.start_time) >= 2.0) return false;
+
+            // Consider duplicate if the normalised text overlaps significantly
+            const text = existingText(existingSeg);
+            return newText === text || newText.includes(text) || text.includes(newText);
           });
 
           return !isDuplicate;
@@ -771,17 +798,17 @@ export function InputScreen({ onAnalyze, onSaveConsultation, onUpdateConsultatio
   // Chunk processing timer - process chunks every 30 seconds during recording
   // CRITICAL: Only process one chunk at a time (sequential, not parallel)
   useEffect(() => {
-    console.log(`⏱️  Recording monitor: isRecording=${isRecording}, time=${recordingTime}s, lastChunk=${lastProcessedChunkIndex}, processing=${isProcessingChunk}`);
+    debugLog(`⏱️  Recording monitor: isRecording=${isRecording}, time=${recordingTime}s, lastChunk=${lastProcessedChunkIndex}, processing=${isProcessingChunk}`);
 
     if (isRecording && recordingTime > 0) {
       // Don't start new chunk if one is already processing
       if (isProcessingChunk) {
-        console.log(`⏸️  Chunk processing already in progress, waiting...`);
+        debugLog(`⏸️  Chunk processing already in progress, waiting...`);
         return;
       }
 
       const shouldProcess = shouldProcessNextChunk(recordingTime, lastProcessedChunkIndex);
-      console.log(`🤔 Should process next chunk? ${shouldProcess} (time=${recordingTime}s >= ${(lastProcessedChunkIndex + 2) * 60}s)`);
+      debugLog(`🤔 Should process next chunk? ${shouldProcess} (time=${recordingTime}s >= ${(lastProcessedChunkIndex + 2) * 60}s)`);
 
       if (shouldProcess) {
         console.log(`🔒 Acquiring processing lock for chunk ${lastProcessedChunkIndex + 1}`);
@@ -846,21 +873,12 @@ export function InputScreen({ onAnalyze, onSaveConsultation, onUpdateConsultatio
           original_text: originalTranscript.trim() && originalTranscript.trim() !== consultation.trim()
             ? originalTranscript
             : undefined,
-          patient_info: {
-            patient_id: preFilledPatient?.id,
-            patient_age: patientDetails?.age,
-            patient_name: patientDetails?.name,
-            sex: patientDetails?.sex,
-            height: patientDetails?.height,
-            weight: patientDetails?.weight,
-            current_medications: patientDetails?.currentMedications,
-            current_conditions: patientDetails?.currentConditions
-          },
+          patient_info: summarizePatientInfo,
           is_from_transcription: true,
           transcription_language: consultationLanguage || 'en'
         };
 
-        const response = await fetch(`${API_URL}/api/summarize`, {
+        const response = await fetchWithRetry(`${API_URL}/api/summarize`, {
           method: 'POST',
           headers: { 'Content-Type': 'application/json' },
           body: JSON.stringify(requestBody)
@@ -963,6 +981,12 @@ export function InputScreen({ onAnalyze, onSaveConsultation, onUpdateConsultatio
         return;
       }
 
+      // Nothing to extract fields from - skip the LLM round trip
+      if (!consultation.trim() && !originalTranscript.trim()) {
+        console.warn('⚠️ Skipping form auto-fill: consultation has no text');
+        return;
+      }
+
       console.log(`📋 Auto-filling form for consultation ${consultationId}...`);
 
       // Get Firebase ID token for authentication
@@ -1061,21 +1085,12 @@ export function InputScreen({ onAnalyze, onSaveConsultation, onUpdateConsultatio
         original_text: originalTranscript.trim() && originalTranscript.trim() !== consultation.trim()
           ? originalTranscript
           : undefined,
-        patient_info: {
-          patient_id: preFilledPatient?.id,
-          patient_age: patientDetails?.age,
-          patient_name: patientDetails?.name,
-          sex: patientDetails?.sex,
-          height: patientDetails?.height,
-          weight: patientDetails?.weight,
-          current_medications: patientDetails?.currentMedications,
-          current_conditions: patientDetails?.currentConditions
-        },
+        patient_info: summarizePatientInfo,
         is_from_transcription: true,
         transcription_language: consultationLanguage || 'en'
       };
 
-      const response = await fetch(`${API_URL}/api/summarize`, {
+      const response = await fetchWithRetry(`${API_URL}/api/summarize`, {
         method: 'POST',
         headers: { 'Content-Type': 'application/json' },
         body: JSON.stringify(requestBody)
@@ -1328,7 +1343,7 @@ export function InputScreen({ onAnalyze, onSaveConsultation, onUpdateConsultatio
     // Capture values from current scope before component unmounts
     const capturedConsultation = consultation;
     const capturedOriginalTranscript = originalTranscript;
-    const capturedPatientDetails = patientDetails;
+    const capturedPatientInfo = summarizePatientInfo;
     const capturedPatientId = preFilledPatient?.id;
     const capturedLanguage = consultationLanguage;
     const capturedAppointmentId = appointmentContext?.id || null;
@@ -1356,21 +1371,12 @@ export function InputScreen({ onAnalyze, onSaveConsultation, onUpdateConsultatio
           original_text: capturedOriginalTranscript.trim() && capturedOriginalTranscript.trim() !== capturedConsultation.trim()
             ? capturedOriginalTranscript
             : undefined,
-          patient_info: {
-            patient_id: capturedPatientId,
-            patient_age: capturedPatientDetails?.age,
-            patient_name: capturedPatientDetails?.name,
-            sex: capturedPatientDetails?.sex,
-            height: capturedPatientDetails?.height,
-            weight: capturedPatientDetails?.weight,
-            current_medications: capturedPatientDetails?.currentMedications,
-            current_conditions: capturedPatientDetails?.currentConditions
-          },
+          patient_info: capturedPatientInfo,
           is_from_transcription: true,
           transcription_language: capturedLanguage || 'en'
         };
 
-        const response = await fetch(`${API_URL}/api/summarize`, {
+        const response = await fetchWithRetry(`${API_URL}/api/summarize`, {
           method: 'POST',
           headers: { 'Content-Type': 'application/json' },
           body: JSON.stringify(requestBody),
@@ -1494,9 +1500,9 @@ export function InputScreen({ onAnalyze, onSaveConsultation, onUpdateConsultatio
     return new Promise(async (resolve, reject) => {
       try {
         // Reset transcription state for new session
-        completedTurnsRef.current = [];
+        completedTurns.clear();
         currentTurnTranscriptRef.current = '';
-        originalCompletedTurnsRef.current = [];
+        originalCompletedTurns.clear();
         currentOriginalTurnRef.current = '';
 
         // Step 1: Get temporary token from our backend
@@ -1523,7 +1529,7 @@ export function InputScreen({ onAnalyze, onSaveConsultation, onUpdateConsultatio
         ws.onmessage = async (event) => {
           try {
             const data = JSON.parse(event.data);
-            console.log('📩 ElevenLabs:', data.message_type, data);
+            debugLog('📩 ElevenLabs:', data.message_type, data);
 
             switch (data.message_type) {
               case 'session_started':
@@ -1537,7 +1543,7 @@ export function InputScreen({ onAnalyze, onSaveConsultation, onUpdateConsultatio
               case 'partial_transcript':
                 // Interim results during processing
                 if (data.text) {
-                  console.log(`[PARTIAL] Text: "${data.text}", Lang: ${data.language_code || 'unknown'}`);
+                  debugLog(`[PARTIAL] Text: "${data.text}", Lang: ${data.language_code || 'unknown'}`);
 
                   // Store original text
                   currentOriginalTurnRef.current = data.text;
@@ -1546,7 +1552,7 @@ export function InputScreen({ onAnalyze, onSaveConsultation, onUpdateConsultatio
                   const displayText = await translateText(data.text);
                   currentTurnTranscriptRef.current = displayText;
 
-                  const completedText = completedTurnsRef.current.join(' ');
+                  const completedText = completedTurns.text;
                   const fullText = completedText
                     ? `${completedText} ${displayText}`
                     : displayText;
@@ -1554,7 +1560,7 @@ export function InputScreen({ onAnalyze, onSaveConsultation, onUpdateConsultatio
                   setInterimTranscript(displayText);
 
                   // Update original transcript state
-                  const originalCompleted = originalCompletedTurnsRef.current.join(' ');
+                  const originalCompleted = originalCompletedTurns.text;
                   const fullOriginal = originalCompleted
                     ? `${originalCompleted} ${data.text}`
                     : data.text;
@@ -1569,23 +1575,23 @@ export function InputScreen({ onAnalyze, onSaveConsultation, onUpdateConsultatio
                   console.log(`[COMMITTED] Text: "${data.text}", Lang: ${data.language_code || 'unknown'}`);
 
                   // Save original transcript
-                  originalCompletedTurnsRef.current.push(data.text);
+                  originalCompletedTurns.push(data.text);
                   currentOriginalTurnRef.current = '';
 
                   // Translate if enabled
                   const translatedText = await translateText(data.text);
 
                   // Save the completed translated transcript
-                  completedTurnsRef.current.push(translatedText);
+                  completedTurns.push(translatedText);
                   currentTurnTranscriptRef.current = '';
 
                   // Update consultation with all completed transcripts (translated)
-                  const fullText = completedTurnsRef.current.join(' ');
+                  const fullText = completedTurns.text;
                   setConsultation(fullText);
                   setInterimTranscript('');
 
                   // Update original transcript state
-                  const fullOriginal = originalCompletedTurnsRef.current.join(' ');
+                  const fullOriginal = originalCompletedTurns.text;
                   setOriginalTranscript(fullOriginal);
 
                   // Update detected language if provided
@@ -1616,14 +1622,14 @@ export function InputScreen({ onAnalyze, onSaveConsultation, onUpdateConsultatio
 
           // On close, ensure any remaining current transcript is saved
           if (currentTurnTranscriptRef.current) {
-            completedTurnsRef.current.push(currentTurnTranscriptRef.current);
-            const finalText = completedTurnsRef.current.join(' ');
+            completedTurns.push(currentTurnTranscriptRef.current);
+            const finalText = completedTurns.text;
             setConsultation(finalText);
             currentTurnTranscriptRef.current = '';
           }
           if (currentOriginalTurnRef.current) {
-            originalCompletedTurnsRef.current.push(currentOriginalTurnRef.current);
-            const finalOriginal = originalCompletedTurnsRef.current.join(' ');
+            originalCompletedTurns.push(currentOriginalTurnRef.current);
+            const finalOriginal = originalCompletedTurns.text;
             setOriginalTranscript(finalOriginal);
             currentOriginalTurnRef.current = '';
           }
@@ -1641,9 +1647,9 @@ export function InputScreen({ onAnalyze, onSaveConsultation, onUpdateConsultatio
     return new Promise(async (resolve, reject) => {
       try {
         // Reset transcription state for new session
-        completedTurnsRef.current = [];
+        completedTurns.clear();
         currentTurnTranscriptRef.current = '';
-        originalCompletedTurnsRef.current = [];
+        originalCompletedTurns.clear();
         currentOriginalTurnRef.current = '';
 
         // Step 1: Get Sarvam API key from our backend
@@ -1681,7 +1687,7 @@ export function InputScreen({ onAnalyze, onSaveConsultation, onUpdateConsultatio
         ws.onmessage = async (event) => {
           try {
             const data = JSON.parse(event.data);
-            console.log('📩 Sarvam:', data.type, data);
+            debugLog('📩 Sarvam:', data.type, data);
 
             switch (data.type) {
               case 'events':
@@ -1698,7 +1704,7 @@ export function InputScreen({ onAnalyze, onSaveConsultation, onUpdateConsultatio
                 // Sarvam STTT data message contains transcript and optionally translation
                 // Structure: { type: 'data', data: { transcript: '...', translation?: '...' } }
                 const payload = data.data;
-                console.log('📝 Sarvam data payload:', payload);
+                debugLog('📝 Sarvam data payload:', payload);
 
                 if (payload) {
                   const transcript = payload.transcript || '';
@@ -1712,20 +1718,20 @@ export function InputScreen({ onAnalyze, onSaveConsultation, onUpdateConsultatio
                     console.log(`[TEXT] "${textForConsultation}"${translation ? ' (translated)' : ''}`);
 
                     // Save the completed transcript
-                    completedTurnsRef.current.push(textForConsultation);
+                    completedTurns.push(textForConsultation);
                     currentTurnTranscriptRef.current = '';
 
                     // Update consultation with all completed transcripts
-                    const fullText = completedTurnsRef.current.join(' ');
+                    const fullText = completedTurns.text;
                     setConsultation(fullText);
                     setInterimTranscript('');
                   }
 
                   // Store original language text if different from what we're showing
                   if (transcript && translation) {
-                    console.log(`[ORIGINAL] ${transcript}`);
-                    originalCompletedTurnsRef.current.push(transcript);
-                    const fullOriginal = originalCompletedTurnsRef.current.join(' ');
+                    debugLog(`[ORIGINAL] ${transcript}`);
+                    originalCompletedTurns.push(transcript);
+                    const fullOriginal = originalCompletedTurns.text;
                     setOriginalTranscript(fullOriginal);
                   }
                 }
@@ -1745,13 +1751,13 @@ export function InputScreen({ onAnalyze, onSaveConsultation, onUpdateConsultatio
                   console.log(`[TRANSLATION] English: "${data.text}"`);
                   const translatedText = data.text;
                   if (data.transcript) {
-                    originalCompletedTurnsRef.current.push(data.transcript);
-                    const fullOriginal = originalCompletedTurnsRef.current.join(' ');
+                    originalCompletedTurns.push(data.transcript);
+                    const fullOriginal = originalCompletedTurns.text;
                     setOriginalTranscript(fullOriginal);
                   }
-                  completedTurnsRef.current.push(translatedText);
+                  completedTurns.push(translatedText);
                   currentTurnTranscriptRef.current = '';
-                  const fullText = completedTurnsRef.current.join(' ');
+                  const fullText = completedTurns.text;
                   setConsultation(fullText);
                   setInterimTranscript('');
                 }
@@ -1760,12 +1766,12 @@ export function InputScreen({ onAnalyze, onSaveConsultation, onUpdateConsultatio
               case 'transcript':
                 // Regular transcript (for STT without translation)
                 if (data.text) {
-                  console.log(`[TRANSCRIPT] Text: "${data.text}"`);
-                  originalCompletedTurnsRef.current.push(data.text);
-                  const fullOriginal = originalCompletedTurnsRef.current.join(' ');
+                  debugLog(`[TRANSCRIPT] Text: "${data.text}"`);
+                  originalCompletedTurns.push(data.text);
+                  const fullOriginal = originalCompletedTurns.text;
                   setOriginalTranscript(fullOriginal);
-                  completedTurnsRef.current.push(data.text);
-                  const fullText = completedTurnsRef.current.join(' ');
+                  completedTurns.push(data.text);
+                  const fullText = completedTurns.text;
                   setConsultation(fullText);
                   setInterimTranscript('');
                 }
@@ -1791,8 +1797,8 @@ export function InputScreen({ onAnalyze, onSaveConsultation, onUpdateConsultatio
 
           // On close, ensure any remaining current transcript is saved
           if (currentTurnTranscriptRef.current) {
-            completedTurnsRef.current.push(currentTurnTranscriptRef.current);
-            const finalText = completedTurnsRef.current.join(' ');
+            completedTurns.push(currentTurnTranscriptRef.current);
+            const finalText = completedTurns.text;
             setConsultation(finalText);
             currentTurnTranscriptRef.current = '';
           }
@@ -1814,7 +1820,7 @@ export function InputScreen({ onAnalyze, onSaveConsultation, onUpdateConsultatio
     }
 
     try {
-      const response = await fetch(`${API_URL}/api/translate`, {
+      const response = await fetchWithRetry(`${API_URL}/api/translate`, {
         method: 'POST',
         headers: { 'Content-Type': 'application/json' },
         body: JSON.stringify({ text })
@@ -1897,12 +1903,7 @@ export function InputScreen({ onAnalyze, onSaveConsultation, onUpdateConsultatio
       processor.onaudioprocess = (e) => {
         if (websocketRef.current?.readyState === WebSocket.OPEN) {
           const inputData = e.inputBuffer.getChannelData(0);
-          const pcmData = float32ToInt16(inputData);
-
-          // Convert to base64
-          const audioBase64 = btoa(
-            String.fromCharCode(...new Uint8Array(pcmData.buffer))
-          );
+          const audioBase64 = encodePcm16Base64(inputData);
 
           // Send in appropriate format based on provider
           if (transcriptionProviderRef.current === 'sarvam') {
@@ -1947,9 +1948,9 @@ export function InputScreen({ onAnalyze, onSaveConsultation, onUpdateConsultatio
         mediaRecorder.ondataavailable = (e) => {
           if (e.data.size > 0 && !isPausedRef.current) {
             audioChunksRef.current.push(e.data);
-            console.log(`📦 Audio chunk collected: ${e.data.size} bytes (total: ${audioChunksRef.current.length} chunks)`);
+            debugLog(`📦 Audio chunk collected: ${e.data.size} bytes (total: ${audioChunksRef.current.length} chunks)`);
           } else if (e.data.size > 0 && isPausedRef.current) {
-            console.log(`⏸️  Skipping paused chunk: ${e.data.size} bytes`);
+            debugLog(`⏸️  Skipping paused chunk: ${e.data.size} bytes`);
           }
         };
 
@@ -2317,6 +2318,13 @@ export function InputScreen({ onAnalyze, onSaveConsultation, onUpdateConsultatio
     await stopStreamingRecording();
   };
 
+  // Segments for the transcript editor. Parsing the raw transcript is only
+  // needed when it changes, not on every recording-timer tick.
+  const editorSegments = useMemo(() => {
+    if (diarizedSegments.length > 0) return diarizedSegments;
+    return consultation.trim() ? parseTranscriptText(consultation) : [];
+  }, [diarizedSegments, consultation]);
+
   // Show error screen if backend is not available
   if (backendStatus === 'error') {
     return (
@@ -2963,12 +2971,7 @@ export function InputScreen({ onAnalyze, onSaveConsultation, onUpdateConsultatio
                 </div>
               ) : (
                 <DiarizedTranscriptEditor
-                  segments={diarizedSegments.length > 0
-                    ? diarizedSegments
-                    : consultation.trim()
-                      ? parseTranscriptText(consultation)
-                      : []
-                  }
+                  segments={editorSegments}
                   onSegmentsChange={(newSegments) => {
                     setDiarizedSegments(newSegments);
                     diarizedSegmentsRef.current = newSegments;
@@ -0,0 +1,110 @@
+import { describe, it, expect, vi, beforeEach } from 'vitest'
+import { render, screen, waitFor, act, fireEvent } from '@testing-library/react'
+import { http, HttpResponse } from 'msw'
+import { server } from '../test/mocks/server'
+import { createMockPatient, createMockAppointmentWithPatient, createMockConsultation } from '../test/fixtures'
+import { PatientDetailView } from './PatientDetailView'
+
+const API_URL = 'http://localhost:8000'
+
+const patient = createMockPatient()
+const appointment = createMockAppointmentWithPatient({ status: 'completed', consultation_id: 'cons-123' })
+const consultation = createMockConsultation({ appointment_id: appointment.id })
+
+vi.mock('../hooks/usePatients', () => ({
+  usePatients: () => ({ updatePatient: vi.fn() }),
+}))
+vi.mock('../hooks/useAppointments', () => ({
+  useAppointments: () => ({ deleteAppointment: vi.fn() }),
+}))
+vi.mock('../contexts/AuthContext', () => ({
+  useAuth: () => ({ isAdmin: false, getIdToken: vi.fn(() => Promise.resolve('test-token')) }),
+}))
+
+vi.mock('./PastAppointmentCard', () => ({
+  PastAppointmentCard: ({ onClick }: { onClick: () => void }) => (
+    <button onClick={onClick}>Open appointment</button>
+  ),
+}))
+
+// Capture the modal's callbacks so the test can trigger a re-summarise directly
+let modalProps: Record<string, any> = {}
+vi.mock('./AppointmentDetailModal', () => ({
+  AppointmentDetailModal: (props: Record<string, any>) => {
+    modalProps = props
+    return <div>Appointment detail</div>
+  },
+}))
+
+// Reads succeed; the consultation summary write fails
+const mockUpdate = vi.fn(() => ({
+  eq: () => Promise.resolve({ error: { message: 'write failed' } }),
+}))
+vi.mock('../lib/supabase', () => ({
+  supabase: {
+    from: vi.fn((table: string) => {
+      if (table === 'appointments') {
+        // select().eq().in().order().order() - the second order() ends the chain
+        let orderCalls = 0
+        const query: Record<string, unknown> = {
+          select: () => query,
+          eq: () => query,
+          in: () => query,
+          order: () => (++orderCalls === 2 ? Promise.resolve({ data: [appointment], error: null }) : query),
+        }
+        return query
+      }
+      return {
+        select: () => ({ in: () => Promise.resolve({ data: [consultation], error: null }) }),
+        update: mockUpdate,
+      }
+    }),
+  },
+}))
+
+describe('PatientDetailView', () => {
+  beforeEach(() => {
+    vi.clearAllMocks()
+    modalProps = {}
+  })
+
+  describe('re-summarising a consultation', () => {
+    it('does not auto-fill the form when saving the new summary fails', async () => {
+      const autoFill = vi.fn(() => HttpResponse.json({ success: true, field_updates: {} }))
+      server.use(
+        http.post(`${API_URL}/api/summarize`, () => HttpResponse.json({
+          success: true,
+          consultation_data: {
+            consultation_text: 'Updated summary',
+            summary_data: {},
+            patient_snapshot: {},
+          },
+        })),
+        http.post(`${API_URL}/api/auto-fill-consultation-form`, autoFill),
+      )
+      const alertSpy = vi.spyOn(window, 'alert').mockImplementation(() => {})
+
+      render(
+        <PatientDetailView
+          patient={patient}
+          onBack={vi.fn()}
+          onEditPatient={vi.fn()}
+          onStartConsultation={vi.fn()}
+        />
+      )
+
+      fireEvent.click(await screen.findByRole('button', { name: 'Open appointment' }))
+      await screen.findByText('Appointment detail')
+
+      await act(async () => {
+        await modalProps.onResummarize(appointment, consultation)
+      })
+
+      await waitFor(() => expect(alertSpy).toHaveBeenCalledWith('Failed to re-summarize consultation. Please try again.'))
+      expect(mockUpdate).toHaveBeenCalledTimes(1)
+      expect(autoFill).not.toHaveBeenCalled()
+
+      alertSpy.mockRestore()
+    })
+  })
+})
@@ -130,6 +130,14 @@ export function PatientDetailView({
     options?: { force_consultation_type?: string; consultation_text_override?: string }
   ) => {
     try {
+      const consultationText = options?.consultation_text_override || consultation.consultation_text || '';
+
+      // Nothing to extract fields from - skip the LLM round trip
+      if (!consultationText.trim() && !consultation.original_transcript?.trim()) {
+        console.warn(`⚠️ Skipping form auto-fill for consultation ${consultation.id}: no text`);
+        return;
+      }
+
       console.log(`📋 Auto-filling form for consultation ${consultation.id}...`);
 
       // Get Firebase ID token for authentication
@@ -144,7 +152,7 @@ export function PatientDetailView({
         appointment_id: appointment.id,
         patient_id: appointment.patient_id,
         original_transcript: consultation.original_transcript || '',
-        consultation_text: options?.consultation_text_override || consultation.consultation_text || '',
+        consultation_text: consultationText,
         patient_snapshot: consultation.patient_snapshot || {}
       };
 
@@ -254,7 +262,9 @@ export function PatientDetailView({
         throw updateError;
       }
 
-      // Extract form fields using the NEW summary text and preserve consultation type
+      // Only auto-fill once the new summary is saved - the endpoint writes the form
+      // server-side, so running it alongside a failed update would leave a form that
+      // doesn't match the consultation's stored summary
       console.log('📋 Extracting form fields from consultation...');
       await extractAndFillForm(appointment, consultation, apiUrl, {
         force_consultation_type: consultation.detected_consultation_type || undefined,
@@ -10,6 +10,15 @@ interface PatientHealthDashboardProps {
   readOnly?: boolean;
 }
 
+type HealthTab = 'overview' | 'vitals' | 'medications' | 'allergies';
+
+const HEALTH_TABS: { id: HealthTab; label: string }[] = [
+  { id: 'overview', label: 'Overview' },
+  { id: 'vitals', label: 'Vital Signs' },
+  { id: 'medications', label: 'Medications' },
+  { id: 'allergies', label: 'Allergies' },
+];
+
 export const PatientHealthDashboard: React.FC<PatientHealthDashboardProps> = ({
   patientId,
   patientName,
@@ -17,7 +26,7 @@ export const PatientHealthDashboard: React.FC<PatientHealthDashboardProps> = ({
 }) => {
   const { summary, loading, error, refetch } = usePatientHealthSummary(patientId);
   const [showVitalsForm, setShowVitalsForm] = useState(false);
-  const [activeTab, setActiveTab] = useState<'overview' | 'vitals' | 'medications' | 'allergies'>('overview');
+  const [activeTab, setActiveTab] = useState<HealthTab>('overview');
 
   if (loading) {
     return (
@@ -62,15 +71,10 @@ export const PatientHealthDashboard: React.FC<PatientHealthDashboardProps> = ({
       {/* Tab Navigation */}
       <div className="border-b border-gray-200">
         <nav className="-mb-px flex space-x-8">
-          {[
-            { id: 'overview', label: 'Overview' },
-            { id: 'vitals', label: 'Vital Signs' },
-            { id: 'medications', label: 'Medications' },
-            { id: 'allergies', label: 'Allergies' },
-          ].map((tab) => (
+          {HEALTH_TABS.map((tab) => (
             <button
               key={tab.id}
-              onClick={() => setActiveTab(tab.id as any)}
+              onClick={() => setActiveTab(tab.id)}
               className={`py-2 px-1 border-b-2 font-medium text-sm transition-colors ${
                 activeTab === tab.id
                   ? 'border-aneya-teal text-aneya-teal'
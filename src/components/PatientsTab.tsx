@@ -15,8 +15,9 @@ export function PatientsTab({ onSelectPatient }: PatientsTabProps) {
   const [editingPatient, setEditingPatient] = useState<Patient | undefined>(undefined);
   const [deletingPatientId, setDeletingPatientId] = useState<string | null>(null);
 
+  const search = searchQuery.toLowerCase();
   const filteredPatients = patients.filter((patient) =>
-    patient.name.toLowerCase().includes(searchQuery.toLowerCase())
+    patient.name.toLowerCase().includes(search)
   );
 
   const handleSavePatient = async (patientData: any) => {
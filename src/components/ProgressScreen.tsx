@@ -18,14 +18,78 @@ const STEP_ORDER = ['geolocation', 'connecting', 'validating', 'analyzing'];
 // Estimated time for diagnosis in seconds
 const ESTIMATED_DIAGNOSIS_TIME = 20;
 
-export function ProgressScreen({ onComplete: _onComplete, streamEvents }: ProgressScreenProps) {
-  const [detectedLocation, setDetectedLocation] = useState<string | null>(null);
-  const [guidelinesSearched, setGuidelinesSearched] = useState<string[]>([]);
+/**
+ * Progress bar and elapsed time for the running analysis.
+ * Kept separate so its 100ms animation ticks only re-render the bar,
+ * not the activity log.
+ */
+function AnalysisProgressBar({ isComplete }: { isComplete: boolean }) {
   const [progress, setProgress] = useState(0);
   const [elapsedTime, setElapsedTime] = useState(0);
-  const eventLogRef = useRef<HTMLDivElement>(null);
   const startTimeRef = useRef<number>(Date.now());
 
+  // Progress bar timer - updates every 100ms for smooth animation
+  useEffect(() => {
+    // If diagnosis is complete, set to 100%
+    if (isComplete) {
+      setProgress(100);
+      return;
+    }
+
+    const interval = setInterval(() => {
+      const elapsed = (Date.now() - startTimeRef.current) / 1000;
+      setElapsedTime(Math.floor(elapsed));
+
+      // Calculate progress percentage with easing
+      // Progress slows down as it approaches 99% (never quite reaches 100 until complete)
+      // If time exceeds estimate, stay at 99%
+      const rawProgress = (elapsed / ESTIMATED_DIAGNOSIS_TIME) * 100;
+      let easedProgress;
+      if (rawProgress >= 100) {
+        // If we've exceeded the estimated time, stay at 99%
+        easedProgress = 99;
+      } else {
+        // Ease in-out: fast at start, slows down as it approaches 99%
+        // Using a power curve for smooth acceleration/deceleration
+        easedProgress = 99 * Math.pow(rawProgress / 100, 0.7);
+      }
+      setProgress(easedProgress);
+    }, 100);
+
+    return () => clearInterval(interval);
+  }, [isComplete]);
+
+  return (
+    <div className="mb-8">
+      <div className="flex items-center justify-between mb-2">
+        <span className="text-[15px] text-aneya-navy font-medium">
+          {isComplete ? 'Analysis complete!' : 'Analyzing...'}
+        </span>
+        <span className="text-[13px] text-aneya-text-secondary">
+          {isComplete
+            ? `Completed in ${elapsedTime}s`
+            : `${elapsedTime}s / ~${ESTIMATED_DIAGNOSIS_TIME}s estimated`
+          }
+        </span>
+      </div>
+      <div className="h-3 bg-gray-200 rounded-full overflow-hidden">
+        <div
+          className={`h-full rounded-full transition-all duration-300 ease-out ${
+            isComplete ? 'bg-aneya-seagreen' : 'bg-aneya-teal'
+          }`}
+          style={{ width: `${progress}%` }}
+        />
+      </div>
+      <div className="mt-2 text-[13px] text-aneya-text-secondary text-center">
+        {Math.round(progress)}% complete
+      </div>
+    </div>
+  );
+}
+
+export function ProgressScreen({ onComplete: _onComplete, streamEvents }: ProgressScreenProps) {
+  const eventLogRef = useRef<HTMLDivElement>(null);
+
   // Track current active step
   const currentStep = useMemo(() => {
     // Find the latest progress event with a step
@@ -75,53 +139,24 @@ export function ProgressScreen({ onComplete: _onComplete, streamEvents }: Progre
     return completed;
   }, [currentStep]);
 
-  // Progress bar timer - updates every 100ms for smooth animation
-  useEffect(() => {
-    // If diagnosis is complete, set to 100%
-    if (currentStep === 'complete') {
-      setProgress(100);
-      return;
-    }
-
-    const interval = setInterval(() => {
-      const elapsed = (Date.now() - startTimeRef.current) / 1000;
-      setElapsedTime(Math.floor(elapsed));
-
-      // Calculate progress percentage with easing
-      // Progress slows down as it approaches 99% (never quite reaches 100 until complete)
-      // If time exceeds estimate, stay at 99%
-      const rawProgress = (elapsed / ESTIMATED_DIAGNOSIS_TIME) * 100;
-      let easedProgress;
-      if (rawProgress >= 100) {
-        // If we've exceeded the estimated time, stay at 99%
-        easedProgress = 99;
-      } else {
-        // Ease in-out: fast at start, slows down as it approaches 99%
-        // Using a power curve for smooth acceleration/deceleration
-        easedProgress = 99 * Math.pow(rawProgress / 100, 0.7);
+  // Location and guideline sources, derived in a single pass over the events
+  // (no extra state updates or re-renders per event)
+  const { detectedLocation, guidelinesSearched } = useMemo(() => {
+    let location: string | null = null;
+    const sources: string[] = [];
+    for (const event of streamEvents) {
+      if (event.type === 'location') {
+        location = `${event.data.country} (${event.data.country_code})`;
+      } else if (event.type === 'guideline_search') {
+        sources.push(event.data.source || 'Unknown source');
       }
-      setProgress(easedProgress);
-    }, 100);
-
-    return () => clearInterval(interval);
-  }, [currentStep]);
+    }
+    return { detectedLocation: location, guidelinesSearched: sources };
+  }, [streamEvents]);
 
   useEffect(() => {
     if (!streamEvents || streamEvents.length === 0) return;
 
-    // Process all events to build up state
-    streamEvents.forEach(event => {
-      if (event.type === 'location') {
-        setDetectedLocation(`${event.data.country} (${event.data.country_code})`);
-      }
-    });
-
-    // For guidelines, only add new ones by checking against current state
-    const allGuidelineSources = streamEvents
-      .filter(e => e.type === 'guideline_search')
-      .map(e => e.data.source || 'Unknown source');
-    setGuidelinesSearched(allGuidelineSources);
-
     // Auto-scroll to bottom
     if (eventLogRef.current) {
       eventLogRef.current.scrollTop = eventLogRef.current.scrollHeight;
@@ -247,30 +282,7 @@ export function ProgressScreen({ onComplete: _onComplete, streamEvents }: Progre
         </p>
 
         {/* Progress Bar */}
-        <div className="mb-8">
-          <div className="flex items-center justify-between mb-2">
-            <span className="text-[15px] text-aneya-navy font-medium">
-              {currentStep === 'complete' ? 'Analysis complete!' : 'Analyzing...'}
-            </span>
-            <span className="text-[13px] text-aneya-text-secondary">
-              {currentStep === 'complete'
-                ? `Completed in ${elapsedTime}s`
-                : `${elapsedTime}s / ~${ESTIMATED_DIAGNOSIS_TIME}s estimated`
-              }
-            </span>
-          </div>
-          <div className="h-3 bg-gray-200 rounded-full overflow-hidden">
-            <div
-              className={`h-full rounded-full transition-all duration-300 ease-out ${
-                currentStep === 'complete' ? 'bg-aneya-seagreen' : 'bg-aneya-teal'
-              }`}
-              style={{ width: `${progress}%` }}
-            />
-          </div>
-          <div className="mt-2 text-[13px] text-aneya-text-secondary text-center">
-            {Math.round(progress)}% complete
-          </div>
-        </div>
+        <AnalysisProgressBar isComplete={currentStep === 'complete'} />
 
         {/* Summary Stats */}
         <div className="grid grid-cols-2 gap-4 mb-6">
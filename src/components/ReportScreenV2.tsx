@@ -9,7 +9,7 @@
  * - Minimal visual noise
  */
 
-import { useState, useMemo } from 'react';
+import { useState, useMemo, useCallback, memo } from 'react';
 import { PrimaryButton } from './PrimaryButton';
 import { FeedbackButton } from './FeedbackButton';
 import { PatientDetails } from './InputScreen';
@@ -64,19 +64,21 @@ export function ReportScreenV2({
 }: ReportScreenV2Props) {
   // Determine if BNF links should be shown (UK only)
   const isUK = location === 'GB';
-  const diagnoses = result.diagnoses || [];
   const niceGuidelines = result.guidelines_found || [];
   const cksTopics = result.cks_topics || [];
   const bnfSummaries = result.bnf_summaries || [];
 
+  // Looked up once per medication on every render while drugs stream in
+  const pendingDrugs = useMemo(() => new Set(drugsPending), [drugsPending]);
+
   // Feedback state
   const [feedbackSubmitted, setFeedbackSubmitted] = useState<Record<string, string>>({});
 
   // API URL from environment
   const API_URL = import.meta.env.VITE_API_URL || 'http://localhost:8000';
 
-  // Feedback handler
-  const handleFeedback = async (
+  // Feedback handler - stable so memoised diagnosis sections can skip re-renders
+  const handleFeedback = useCallback(async (
     feedbackType: string,
     sentiment: 'positive' | 'negative',
     data: any
@@ -120,11 +122,11 @@ export function ReportScreenV2({
       console.error('❌ Failed to submit feedback:', error);
       throw error;
     }
-  };
+  }, [consultationId, API_URL]);
 
   // Convert diagnoses to consistent format
   const convertedDiagnoses = useMemo(() => {
-    return diagnoses.map((diag: any) => {
+    return (result.diagnoses || []).map((diag: any) => {
       if (diag.primary_care || diag.surgery || diag.diagnostics) {
         return diag;
       }
@@ -138,7 +140,7 @@ export function ReportScreenV2({
         }
       };
     });
-  }, [diagnoses]);
+  }, [result.diagnoses]);
 
   return (
     <div className="min-h-screen bg-aneya-cream">
@@ -259,7 +261,7 @@ export function ReportScreenV2({
               isPrimary={idx === 0}
               number={idx + 1}
               drugDetails={drugDetails}
-              drugsPending={drugsPending}
+              pendingDrugs={pendingDrugs}
               showBnfLink={isUK}
               consultationId={consultationId}
               onFeedback={handleFeedback}
@@ -401,14 +403,16 @@ interface DiagnosisSectionProps {
   isPrimary: boolean;
   number: number;
   drugDetails: Record<string, any>;
-  drugsPending: string[];
+  pendingDrugs: ReadonlySet<string>;
   showBnfLink?: boolean;
   consultationId?: string | null;
   onFeedback?: (type: string, sentiment: 'positive' | 'negative', data: any) => Promise<void>;
   feedbackSubmitted?: Record<string, string>;
 }
 
-function DiagnosisSection({ diagnosis, isPrimary, number, drugDetails, drugsPending, showBnfLink = true, consultationId, onFeedback, feedbackSubmitted }: DiagnosisSectionProps) {
+// Memoised: the report re-renders for unrelated parent updates (PDF generation
+// state, appointment refreshes) that don't change any diagnosis
+const DiagnosisSection = memo(function DiagnosisSection({ diagnosis, isPrimary, number, drugDetails, pendingDrugs, showBnfLink = true, consultationId, onFeedback, feedbackSubmitted }: DiagnosisSectionProps) {
   const [isOpen, setIsOpen] = useState(isPrimary); // Only primary expanded by default
   const [isMarkedCorrect, setIsMarkedCorrect] = useState(false);
 
@@ -522,7 +526,7 @@ function DiagnosisSection({ diagnosis, isPrimary, number, drugDetails, drugsPend
                 <TreatmentContent
                   primaryCare={diagnosis.primary_care}
                   drugDetails={drugDetails}
-                  drugsPending={drugsPending}
+                  pendingDrugs={pendingDrugs}
                   showBnfLink={showBnfLink}
                   consultationId={consultationId}
                   onFeedback={onFeedback}
@@ -577,7 +581,7 @@ function DiagnosisSection({ diagnosis, isPrimary, number, drugDetails, drugsPend
       )}
     </div>
   );
-}
+});
 
 // ============================================
 // Treatment Content
@@ -586,7 +590,7 @@ function DiagnosisSection({ diagnosis, isPrimary, number, drugDetails, drugsPend
 function TreatmentContent({
   primaryCare,
   drugDetails,
-  drugsPending,
+  pendingDrugs,
   showBnfLink = true,
   consultationId,
   onFeedback,
@@ -594,7 +598,7 @@ function TreatmentContent({
 }: {
   primaryCare: any;
   drugDetails: Record<string, any>;
-  drugsPending: string[];
+  pendingDrugs: ReadonlySet<string>;
   showBnfLink?: boolean;
   consultationId?: string | null;
   onFeedback?: (type: string, sentiment: 'positive' | 'negative', data: any) => Promise<void>;
@@ -610,7 +614,7 @@ function TreatmentContent({
             {primaryCare.medications.map((drug: any, idx: number) => {
               const drugName = typeof drug === 'string' ? drug : drug?.drug_name || String(drug);
               const details = drugDetails[drugName];
-              const isPending = drugsPending.includes(drugName);
+              const isPending = pendingDrugs.has(drugName);
               return (
                 <MedicationItem
                   key={idx}
@@ -678,6 +682,7 @@ function MedicationItem({
   const [isOpen, setIsOpen] = useState(false);
   const hasDetails = details?.bnf_data || details?.drugbank_data;
   const isLoading = isPending && !hasDetails;
+  const feedbackId = `drug_${drugName.toLowerCase().replace(/\s+/g, '_')}`;
 
   return (
     <div className="border border-aneya-soft-pink rounded-lg overflow-hidden">
@@ -738,12 +743,12 @@ function MedicationItem({
                 <span className="text-xs text-aneya-text-secondary">Helpful?</span>
                 <FeedbackButton
                   onFeedback={(sentiment) => onFeedback('drug_recommendation', sentiment, {
-                    component_identifier: `drug_${drugName.toLowerCase().replace(/\s+/g, '_')}`,
+                    component_identifier: feedbackId,
                     drug_name: drugName,
                     drug_dosage: details?.bnf_data?.dosage
                   })}
                   size="sm"
-                  initialSentiment={feedbackSubmitted?.[`drug_${drugName.toLowerCase().replace(/\s+/g, '_')}`] as 'positive' | 'negative' | null}
+                  initialSentiment={feedbackSubmitted?.[feedbackId] as 'positive' | 'negative' | null}
                 />
               </div>
             )}
@@ -838,13 +843,14 @@ function FollowUpContent({ followUp }: { followUp: any }) {
 // Confidence Badge
 // ============================================
 
+const CONFIDENCE_COLORS: Record<string, string> = {
+  high: 'bg-aneya-teal/10 text-aneya-teal border-aneya-teal/30',
+  medium: 'bg-amber-50 text-amber-700 border-amber-200',
+  low: 'bg-red-50 text-red-700 border-red-200',
+};
+
 function ConfidenceBadge({ confidence }: { confidence: string }) {
-  const colors: Record<string, string> = {
-    high: 'bg-aneya-teal/10 text-aneya-teal border-aneya-teal/30',
-    medium: 'bg-amber-50 text-amber-700 border-amber-200',
-    low: 'bg-red-50 text-red-700 border-red-200',
-  };
-  const colorClass = colors[confidence.toLowerCase()] || 'bg-aneya-cream text-aneya-text-secondary border-aneya-soft-pink';
+  const colorClass = CONFIDENCE_COLORS[confidence.toLowerCase()] || 'bg-aneya-cream text-aneya-text-secondary border-aneya-soft-pink';
 
   return (
     <span className={`px-2 py-0.5 text-xs font-medium rounded-full border ${colorClass}`}>
@@ -1,4 +1,5 @@
 import { useState } from 'react';
+import { truncateText } from '../utils/textHelpers';
 
 interface SpeakerSegment {
   speaker_id: string;
@@ -72,9 +73,7 @@ export function SpeakerMappingModal({
     const firstSegment = segments.find(seg => seg.speaker_id === speakerId);
     if (!firstSegment) return '';
 
-    // Truncate to 100 characters
-    const text = firstSegment.text.trim();
-    return text.length > 100 ? text.substring(0, 100) + '...' : text;
+    return truncateText(firstSegment.text.trim(), 100);
   };
 
   return (
@@ -13,6 +13,20 @@ interface StructuredSummaryDisplayProps {
   feedbackSubmitted?: Record<string, string>;
 }
 
+/**
+ * Return a copy of `data` with `value` set at `path`.
+ * Only the objects along the path are copied; the rest of the summary
+ * (transcript, timeline, etc.) is shared with the original.
+ */
+function setAtPath<T>(data: T, path: string[], value: any): T {
+  if (path.length === 0) return value;
+  const [key, ...rest] = path;
+  const source: any = data ?? {};
+  const copy: any = Array.isArray(source) ? [...source] : { ...source };
+  copy[key] = setAtPath(source[key], rest, value);
+  return copy;
+}
+
 export const StructuredSummaryDisplay: React.FC<StructuredSummaryDisplayProps> = ({
   summaryData,
   onUpdate,
@@ -36,15 +50,7 @@ export const StructuredSummaryDisplay: React.FC<StructuredSummaryDisplayProps> =
   };
 
   const updateField = (path: string[], value: any) => {
-    const updated = JSON.parse(JSON.stringify(summaryData));
-    let current: any = updated;
-
-    for (let i = 0; i < path.length - 1; i++) {
-      current = current[path[i]];
-    }
-    current[path[path.length - 1]] = value;
-
-    onUpdate(updated);
+    onUpdate(setAtPath(summaryData, path, value));
   };
 
   // Create a callback for confirming field save to DB
@@ -52,15 +58,7 @@ export const StructuredSummaryDisplay: React.FC<StructuredSummaryDisplayProps> =
     if (!onConfirmFieldSave) return undefined;
 
     return async (value: string) => {
-      const updated = JSON.parse(JSON.stringify(summaryData));
-      let current: any = updated;
-
-      for (let i = 0; i < path.length - 1; i++) {
-        current = current[path[i]];
-      }
-      current[path[path.length - 1]] = value;
-
-      await onConfirmFieldSave(updated);
+      await onConfirmFieldSave(setAtPath(summaryData, path, value));
     };
   };
 
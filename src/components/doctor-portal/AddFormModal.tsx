@@ -1,5 +1,6 @@
 import { useState, useEffect } from 'react';
 import { useAuth } from '../../contexts/AuthContext';
+import { invalidateFormSchemas } from '../../lib/formSchemas';
 
 const API_URL = import.meta.env.VITE_API_URL || 'http://localhost:8000';
 
@@ -103,6 +104,7 @@ export function AddFormModal({ onClose, onFormAdded }: AddFormModalProps) {
       }
 
       // Refresh available forms list and notify parent
+      invalidateFormSchemas();
       await fetchAvailableForms();
       onFormAdded();
     } catch (err) {
@@ -1,7 +1,6 @@
 import { useState, useEffect } from 'react';
 import { MedicalForm } from './MedicalForm';
-
-const API_URL = import.meta.env.VITE_API_URL || 'http://localhost:8000';
+import { getFormSchemas } from '../../lib/formSchemas';
 
 interface FormSchema {
   id: string;
@@ -54,12 +53,7 @@ export function ConsultationFormSelector({
         setIsLoading(true);
         setError(null);
 
-        const response = await fetch(`${API_URL}/api/form-schemas`);
-        if (!response.ok) {
-          throw new Error('Failed to fetch form schemas');
-        }
-
-        const data = await response.json();
+        const data = await getFormSchemas();
 
         // Filter forms by specialty
         const formsForSpecialty = data.schemas.filter(
@@ -1,6 +1,7 @@
 import { useState, useEffect } from 'react';
 import { useAuth } from '../../contexts/AuthContext';
 import { MedicalForm } from './MedicalForm';
+import { invalidateFormSchemas } from '../../lib/formSchemas';
 
 const API_URL = import.meta.env.VITE_API_URL || 'http://localhost:8000';
 
@@ -122,6 +123,7 @@ export function CustomFormLibrary({ onEditForm }: CustomFormLibraryProps = {}) {
         throw new Error(errorData.detail || 'Failed to delete form');
       }
 
+      invalidateFormSchemas();
       await loadForms();
     } catch (err) {
       setError(err instanceof Error ? err.message : 'Failed to delete form');
@@ -156,6 +158,7 @@ export function CustomFormLibrary({ onEditForm }: CustomFormLibraryProps = {}) {
         throw new Error(errorData.detail || 'Failed to remove form');
       }
 
+      invalidateFormSchemas();
       await loadForms();
     } catch (err) {
       setError(err instanceof Error ? err.message : 'Failed to remove form');
@@ -190,6 +193,7 @@ export function CustomFormLibrary({ onEditForm }: CustomFormLibraryProps = {}) {
         throw new Error(errorData.detail || 'Failed to share form');
       }
 
+      invalidateFormSchemas();
       await loadForms();
     } catch (err) {
       setError(err instanceof Error ? err.message : 'Failed to share form');
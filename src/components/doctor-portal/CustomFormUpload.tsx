@@ -1,6 +1,7 @@
 import { useState, useEffect, useRef } from 'react';
 import { useAuth } from '../../contexts/AuthContext';
 import { SchemaReviewEditor } from './SchemaReviewEditor';
+import { invalidateFormSchemas } from '../../lib/formSchemas';
 
 const API_URL = import.meta.env.VITE_API_URL || 'http://localhost:8000';
 
@@ -341,6 +342,7 @@ export function CustomFormUpload({ onFormSaved, editingForm }: CustomFormUploadP
       }
 
       if (response.ok) {
+        invalidateFormSchemas();
         setUploadState('complete');
         // Reset form
         setFiles([]);
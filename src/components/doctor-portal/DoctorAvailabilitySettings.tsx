@@ -37,7 +37,7 @@ interface Props {
 type TabType = 'weekly' | 'blocked';
 
 export function DoctorAvailabilitySettings({ onClose }: Props) {
-  const { availability, loading, error, createAvailability, deleteAvailability } = useDoctorAvailability();
+  const { availability, loading, error, createAvailabilities, deleteAvailability } = useDoctorAvailability();
   const { blockedSlots, loading: loadingBlocked, error: errorBlocked, createBlockedSlot, deleteBlockedSlot } = useBlockedSlots();
 
   const [activeTab, setActiveTab] = useState<TabType>('weekly');
@@ -79,22 +79,18 @@ export function DoctorAvailabilitySettings({ onClose }: Props) {
     }
 
     setSaving(true);
-    let successCount = 0;
-
-    // Create availability for each selected day
-    for (const day of selectedDays) {
-      const slotInput: CreateAvailabilityInput = {
-        day_of_week: day,
-        start_time: newSlotTimes.start_time,
-        end_time: newSlotTimes.end_time,
-        slot_duration_minutes: newSlotTimes.slot_duration_minutes
-      };
-      const result = await createAvailability(slotInput);
-      if (result) successCount++;
-    }
+
+    // Create availability for every selected day in one request (days that fail are reported by the hook)
+    const slotInputs: CreateAvailabilityInput[] = selectedDays.map(day => ({
+      day_of_week: day,
+      start_time: newSlotTimes.start_time,
+      end_time: newSlotTimes.end_time,
+      slot_duration_minutes: newSlotTimes.slot_duration_minutes
+    }));
+    const created = await createAvailabilities(slotInputs);
 
     setSaving(false);
-    if (successCount > 0) {
+    if (created && created.length > 0) {
       setSelectedDays([1, 2, 3, 4, 5]); // Reset to weekdays
       setNewSlotTimes({
         start_time: '09:00',
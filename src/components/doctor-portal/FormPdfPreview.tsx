@@ -12,7 +12,7 @@ import {
   StyleSheet,
   Image,
 } from '@react-pdf/renderer';
-import { generateSampleFormData, formatFieldLabel } from '../../utils/formSampleData';
+import { generateSampleFormData, formatFieldLabel, SCHEMA_METADATA_KEYS } from '../../utils/formSampleData';
 
 interface ClinicBranding {
   clinic_name?: string | null;
@@ -451,7 +451,7 @@ export const FormPdfDocument: React.FC<FormPdfDocumentProps> = ({
   const data = hasRealData ? formData! : generateSampleFormData(schema);
 
   const sortedSections = Object.entries(schema)
-    .filter(([name]) => !['title', 'description', 'version', 'type'].includes(name))
+    .filter(([name]) => !SCHEMA_METADATA_KEYS.has(name))
     .sort(([, a], [, b]) => (a.order || 999) - (b.order || 999));
 
   const displayName = formatFieldLabel(formName);
@@ -25,6 +25,17 @@ interface FieldComparison {
   approved: boolean;
 }
 
+// Extracted vital sign keys and their display labels
+const VITAL_FIELDS = [
+  { key: 'systolic_bp', label: 'Systolic BP (mmHg)' },
+  { key: 'diastolic_bp', label: 'Diastolic BP (mmHg)' },
+  { key: 'heart_rate', label: 'Heart Rate (bpm)' },
+  { key: 'respiratory_rate', label: 'Respiratory Rate' },
+  { key: 'temperature_celsius', label: 'Temperature (°C)' },
+  { key: 'spo2', label: 'SpO2 (%)' },
+  { key: 'blood_glucose_mg_dl', label: 'Blood Glucose (mg/dL)' },
+] as const;
+
 export function HistoricalFormReview({
   importRecord,
   onSubmitReview,
@@ -80,17 +91,7 @@ export function HistoricalFormReview({
     // Vitals
     if (extracted_data.vitals && Array.isArray(extracted_data.vitals)) {
       extracted_data.vitals.forEach((vital: any, index: number) => {
-        const vitalFields = [
-          { key: 'systolic_bp', label: 'Systolic BP (mmHg)' },
-          { key: 'diastolic_bp', label: 'Diastolic BP (mmHg)' },
-          { key: 'heart_rate', label: 'Heart Rate (bpm)' },
-          { key: 'respiratory_rate', label: 'Respiratory Rate' },
-          { key: 'temperature_celsius', label: 'Temperature (°C)' },
-          { key: 'spo2', label: 'SpO2 (%)' },
-          { key: 'blood_glucose_mg_dl', label: 'Blood Glucose (mg/dL)' },
-        ];
-
-        vitalFields.forEach(({ key, label }) => {
+        VITAL_FIELDS.forEach(({ key, label }) => {
           if (vital[key] !== undefined && vital[key] !== null) {
             addField(
               `Vitals #${index + 1}`,
@@ -1,6 +1,13 @@
 import { useState } from 'react';
 import { usePatientInvitations } from '../../hooks/usePatientInvitations';
 
+const INVITATION_STATUS_STYLES: Record<string, string> = {
+  pending: 'bg-yellow-100 text-yellow-800',
+  accepted: 'bg-green-100 text-green-800',
+  expired: 'bg-gray-100 text-gray-600',
+  cancelled: 'bg-red-100 text-red-800'
+};
+
 export function InvitePatientsTab() {
   const { sendInvitation, sentInvitations, cancelInvitation, resendInvitation, loading, error } = usePatientInvitations();
   const [email, setEmail] = useState('');
@@ -50,14 +57,8 @@ export function InvitePatientsTab() {
   };
 
   const getStatusBadge = (status: string) => {
-    const styles: Record<string, string> = {
-      pending: 'bg-yellow-100 text-yellow-800',
-      accepted: 'bg-green-100 text-green-800',
-      expired: 'bg-gray-100 text-gray-600',
-      cancelled: 'bg-red-100 text-red-800'
-    };
     return (
-      <span className={`px-2 py-0.5 rounded-full text-xs font-medium ${styles[status] || 'bg-gray-100'}`}>
+      <span className={`px-2 py-0.5 rounded-full text-xs font-medium ${INVITATION_STATUS_STYLES[status] || 'bg-gray-100'}`}>
         {status.charAt(0).toUpperCase() + status.slice(1)}
       </span>
     );
@@ -1,9 +1,8 @@
 import { useState, useEffect, useRef, useCallback } from 'react';
 import { Activity, Download } from 'lucide-react';
-import { pdf } from '@react-pdf/renderer';
 import { consultationEventBus } from '../../lib/consultationEventBus';
-import { generateSampleFormData } from '../../utils/formSampleData';
-import { FormPdfDocument } from './FormPdfPreview';
+import { getFormSchema, FormSchemaRequestError } from '../../lib/formSchemas';
+import { generateSampleFormData, SCHEMA_METADATA_KEYS } from '../../utils/formSampleData';
 
 const API_URL = import.meta.env.VITE_API_URL || 'http://localhost:8000';
 
@@ -139,11 +138,10 @@ export function MedicalForm({
         setIsLoading(true);
         setLoadError(null);
 
-        const response = await fetch(`${API_URL}/api/form-schema/${formType}`);
-        const data = await response.json();
+        const data = await getFormSchema(formType);
 
-        if (!response.ok || data.detail) {
-          setLoadError(data.detail || `Failed to load ${formType} form`);
+        if (data.detail) {
+          setLoadError(data.detail);
           return;
         }
 
@@ -156,6 +154,10 @@ export function MedicalForm({
         setFormTitle(title);
         setSchema(data.schema);
       } catch (error) {
+        if (error instanceof FormSchemaRequestError) {
+          setLoadError(error.message);
+          return;
+        }
         setLoadError(`Error loading form: ${error instanceof Error ? error.message : 'Unknown error'}`);
       } finally {
         if (isMountedRef.current) setIsLoading(false);
@@ -216,53 +218,65 @@ export function MedicalForm({
       try {
         const { supabase } = await import('../../lib/supabase');
 
+        const tableFields: { sectionName: string; field: FormField }[] = [];
         for (const [sectionName, sectionDef] of Object.entries(schema)) {
           if (!Array.isArray(sectionDef.fields)) continue;
 
           for (const field of sectionDef.fields) {
             if (!field.data_source || (field.input_type !== 'table' && field.input_type !== 'table_transposed')) continue;
+            tableFields.push({ sectionName, field });
+          }
+        }
 
-            const { table: tableName, filters = {}, order_by: orderBy, field_mapping: fieldMapping = {} } = field.data_source;
+        // Fields are independent, so query their sources concurrently
+        const results = await Promise.all(tableFields.map(async ({ sectionName, field }) => {
+          const { table: tableName, filters = {}, order_by: orderBy, field_mapping: fieldMapping = {} } = field.data_source!;
 
-            let query = supabase.from(tableName).select('*');
+          let query = supabase.from(tableName).select('*');
 
-            for (const [filterKey, filterValue] of Object.entries(filters)) {
-              let actualValue: string = filterValue;
-              if (typeof filterValue === 'string' && filterValue.includes('{{')) {
-                actualValue = filterValue
-                  .replace('{{patient_id}}', patientId || '')
-                  .replace('{{appointment_id}}', appointmentId || '');
-              }
-              query = query.eq(filterKey, actualValue);
+          for (const [filterKey, filterValue] of Object.entries(filters)) {
+            let actualValue: string = filterValue;
+            if (typeof filterValue === 'string' && filterValue.includes('{{')) {
+              actualValue = filterValue
+                .replace('{{patient_id}}', patientId || '')
+                .replace('{{appointment_id}}', appointmentId || '');
             }
+            query = query.eq(filterKey, actualValue);
+          }
 
-            if (orderBy) {
-              query = query.order(orderBy.field, { ascending: orderBy.ascending !== false });
-            }
+          if (orderBy) {
+            query = query.order(orderBy.field, { ascending: orderBy.ascending !== false });
+          }
 
-            const { data: records, error } = await query;
-            if (error || !records?.length) continue;
+          const { data: records, error } = await query;
+          if (error || !records?.length) return null;
 
-            const transformedRecords = records.map(record => {
-              if (Object.keys(fieldMapping).length > 0) {
+          // Resolve the mapping once per field rather than once per record
+          const mappingEntries = Object.entries(fieldMapping);
+          const transformedRecords = mappingEntries.length === 0
+            ? records
+            : records.map(record => {
                 const transformed: Record<string, any> = {};
-                for (const [targetField, sourceField] of Object.entries(fieldMapping)) {
+                for (const [targetField, sourceField] of mappingEntries) {
                   transformed[targetField] = record[sourceField];
                 }
                 return transformed;
-              }
-              return record;
-            });
-
-            setFormData(prev => ({
-              ...prev,
-              [sectionName]: {
-                ...prev[sectionName],
-                [field.name]: transformedRecords,
-              },
-            }));
+              });
+
+          return { sectionName, fieldName: field.name, records: transformedRecords };
+        }));
+
+        const populated = results.filter((r): r is NonNullable<typeof r> => r !== null);
+        if (populated.length === 0) return;
+
+        // Apply every populated table in a single state update
+        setFormData(prev => {
+          const next = { ...prev };
+          for (const { sectionName, fieldName, records } of populated) {
+            next[sectionName] = { ...next[sectionName], [fieldName]: records };
           }
-        }
+          return next;
+        });
       } catch (error) {
         console.error('Failed to populate external data sources:', error);
       }
@@ -458,6 +472,12 @@ export function MedicalForm({
         clinic_name: clinicName,
       };
 
+      // Loaded on demand - the PDF renderer is large and MedicalForm is in the main bundle
+      const [{ pdf }, { FormPdfDocument }] = await Promise.all([
+        import('@react-pdf/renderer'),
+        import('./FormPdfPreview'),
+      ]);
+
       const blob = await pdf(
         <FormPdfDocument
           schema={schema}
@@ -486,7 +506,7 @@ export function MedicalForm({
   // --- Sorted sections ---
   const sortedSections = schema
     ? Object.entries(schema)
-        .filter(([name]) => !['title', 'description', 'version', 'type'].includes(name))
+        .filter(([name]) => !SCHEMA_METADATA_KEYS.has(name))
         .sort(([, a], [, b]) => (a.order || 999) - (b.order || 999))
     : [];
 
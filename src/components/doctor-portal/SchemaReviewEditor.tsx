@@ -1,7 +1,5 @@
 import { useState } from 'react';
-import { pdf } from '@react-pdf/renderer';
 import { useAuth } from '../../contexts/AuthContext';
-import { FormPdfDocument } from './FormPdfPreview';
 
 interface SchemaReviewEditorProps {
   formName: string;
@@ -312,7 +310,11 @@ export function SchemaReviewEditor({
         <button
           onClick={async () => {
             try {
-              // Generate PDF locally using @react-pdf/renderer
+              // Generate PDF locally using @react-pdf/renderer (loaded on demand)
+              const [{ pdf }, { FormPdfDocument }] = await Promise.all([
+                import('@react-pdf/renderer'),
+                import('./FormPdfPreview'),
+              ]);
               const extractedLogoUrl = (!logoRejected && logoInfo?.logo_url) ? logoInfo.logo_url : null;
               const clinicBranding = {
                 clinic_name: doctorProfile?.clinic_name || logoInfo?.facility_name || null,
@@ -54,16 +54,17 @@ export function MyDoctors({ onBack: _onBack }: Props) {
   };
 
   // Get doctor IDs that patient already has relationship with
-  const existingDoctorIds = myDoctors.map(rel => rel.doctor_id);
+  const existingDoctorIds = new Set(myDoctors.map(rel => rel.doctor_id));
 
   // Filter available doctors (not already connected)
+  const search = searchTerm.toLowerCase();
   const availableDoctors = allDoctors.filter(
-    doctor => !existingDoctorIds.includes(doctor.id)
+    doctor => !existingDoctorIds.has(doctor.id)
   ).filter(doctor =>
-    searchTerm === '' ||
-    doctor.name.toLowerCase().includes(searchTerm.toLowerCase()) ||
-    (doctor.specialty?.toLowerCase().includes(searchTerm.toLowerCase())) ||
-    (doctor.clinic_name?.toLowerCase().includes(searchTerm.toLowerCase()))
+    search === '' ||
+    doctor.name.toLowerCase().includes(search) ||
+    (doctor.specialty?.toLowerCase().includes(search)) ||
+    (doctor.clinic_name?.toLowerCase().includes(search))
   );
 
   const handleRequestDoctor = async (doctorId: string) => {
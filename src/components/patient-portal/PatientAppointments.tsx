@@ -54,31 +54,31 @@ export function PatientAppointments({ onBack }: Props) {
 
       if (fetchError) throw fetchError;
 
-      // For each appointment with OB/GYN doctor, fetch the form status
-      const appointmentsWithForms = await Promise.all(
-        (data || []).map(async (apt: any) => {
-          if (requiresOBGynForms(apt.doctor?.specialty)) {
-            try {
-              const { data: formData, error: formError } = await supabase
-                .from('obgyn_consultation_forms')
-                .select('status')
-                .eq('appointment_id', apt.id)
-                .eq('form_type', 'pre_consultation')
-                .single();
-
-              if (!formError && formData) {
-                return {
-                  ...apt,
-                  obgynFormStatus: formData.status,
-                };
-              }
-            } catch (err) {
-              // Form doesn't exist yet, that's ok
-            }
+      // Fetch pre-consultation form status for all OB/GYN appointments in one query
+      const obgynAppointmentIds = (data || [])
+        .filter((apt: any) => requiresOBGynForms(apt.doctor?.specialty))
+        .map((apt: any) => apt.id);
+
+      const formStatusByAppointment = new Map<string, string>();
+      if (obgynAppointmentIds.length > 0) {
+        const { data: forms, error: formError } = await supabase
+          .from('obgyn_consultation_forms')
+          .select('appointment_id, status')
+          .in('appointment_id', obgynAppointmentIds)
+          .eq('form_type', 'pre_consultation');
+
+        // Missing forms are fine - those appointments just have no status yet
+        if (!formError) {
+          for (const form of forms || []) {
+            formStatusByAppointment.set(form.appointment_id, form.status);
           }
-          return apt;
-        })
-      );
+        }
+      }
+
+      const appointmentsWithForms = (data || []).map((apt: any) => {
+        const obgynFormStatus = formStatusByAppointment.get(apt.id);
+        return obgynFormStatus ? { ...apt, obgynFormStatus } : apt;
+      });
 
       setAppointments(appointmentsWithForms);
     } catch (err) {
@@ -2,6 +2,7 @@ import { useState, useRef, useEffect } from 'react';
 import { useAuth } from '../../contexts/AuthContext';
 import { usePatientSymptoms } from '../../hooks/usePatientSymptoms';
 import { PatientSymptom, SymptomStatus, ConsultationLanguage, CONSULTATION_LANGUAGES } from '../../types/database';
+import { encodePcm16Base64 } from '../../utils/pcmEncoding';
 
 const API_URL = import.meta.env.VITE_API_URL || 'http://localhost:8000';
 const SARVAM_WS_URL = 'wss://api.sarvam.ai/speech-to-text-translate/ws';
@@ -13,16 +14,6 @@ function formatTime(seconds: number): string {
   return `${mins.toString().padStart(2, '0')}:${secs.toString().padStart(2, '0')}`;
 }
 
-// Convert Float32Array audio samples to 16-bit PCM
-function float32ToInt16(float32Array: Float32Array): Int16Array {
-  const int16Array = new Int16Array(float32Array.length);
-  for (let i = 0; i < float32Array.length; i++) {
-    const s = Math.max(-1, Math.min(1, float32Array[i]));
-    int16Array[i] = s < 0 ? s * 0x8000 : s * 0x7fff;
-  }
-  return int16Array;
-}
-
 const STATUS_OPTIONS: { value: SymptomStatus; label: string; color: string }[] = [
   { value: 'active', label: 'Active', color: 'bg-red-100 text-red-800' },
   { value: 'improving', label: 'Improving', color: 'bg-green-100 text-green-800' },
@@ -224,12 +215,7 @@ export function SymptomsTab({ onBack: _onBack }: SymptomsTabProps) {
       processor.onaudioprocess = (e) => {
         if (websocketRef.current?.readyState === WebSocket.OPEN) {
           const inputData = e.inputBuffer.getChannelData(0);
-          const pcmData = float32ToInt16(inputData);
-
-          // Convert to base64
-          const audioBase64 = btoa(
-            String.fromCharCode(...new Uint8Array(pcmData.buffer))
-          );
+          const audioBase64 = encodePcm16Base64(inputData);
 
           // Send in Sarvam format
           websocketRef.current.send(JSON.stringify({
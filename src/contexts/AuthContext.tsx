@@ -13,6 +13,7 @@ import { auth, googleProvider } from '../lib/firebase';
 import { supabase } from '../lib/supabase';
 import type { UserRole, Doctor, Patient } from '../types/database';
 import { sendOTP } from '../lib/api';
+import { clearUserIpCache } from '../lib/geolocation';
 
 // Compatible User interface (maps Firebase user to expected shape)
 interface User {
@@ -981,6 +982,7 @@ export function AuthProvider({ children }: { children: React.ReactNode }) {
   const signOut = async () => {
     try {
       await firebaseSignOut(auth);
+      clearUserIpCache();
       console.log('✅ Signed out successfully');
       // Note: Supabase client will automatically stop including Firebase token
       // in requests once auth.currentUser is null
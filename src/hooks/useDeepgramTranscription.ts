@@ -1,4 +1,5 @@
 import { useState, useRef, useCallback } from 'react';
+import { debugLog } from '../utils/logger';
 
 const API_URL = import.meta.env.VITE_API_URL || 'http://localhost:8000';
 
@@ -100,7 +101,7 @@ export function useDeepgramTranscription(): UseDeepgramTranscriptionReturn {
       ws.onmessage = (event) => {
         try {
           const data = JSON.parse(event.data);
-          console.log('WS message:', data);
+          debugLog('WS message:', data);
 
           switch (data.type) {
             case 'connected':
@@ -0,0 +1,69 @@
+import { describe, it, expect, vi, beforeEach } from 'vitest'
+import { renderHook, waitFor, act } from '@testing-library/react'
+
+// Bulk inserts fail; single-row inserts succeed except for Wednesday (day 3)
+const mockInsert = vi.fn((rows: any) => {
+  if (Array.isArray(rows)) {
+    return { select: () => Promise.resolve({ data: null, error: { message: 'bulk insert failed' } }) }
+  }
+  return {
+    select: () => ({
+      single: () => Promise.resolve(
+        rows.day_of_week === 3
+          ? { data: null, error: { message: 'overlapping slot' } }
+          : { data: { id: `avail-${rows.day_of_week}`, ...rows }, error: null }
+      ),
+    }),
+  }
+})
+
+vi.mock('../lib/supabase', () => ({
+  supabase: {
+    from: vi.fn(() => ({
+      select: () => ({
+        eq: () => ({
+          order: () => ({
+            order: () => Promise.resolve({ data: [], error: null }),
+          }),
+        }),
+      }),
+      insert: mockInsert,
+    })),
+  },
+}))
+
+vi.mock('../contexts/AuthContext', () => ({
+  useAuth: vi.fn(() => ({ doctorProfile: null })),
+}))
+
+// Import after mocks are set up
+import { useDoctorAvailability } from './useDoctorAvailability'
+
+const slot = (day_of_week: number) => ({
+  day_of_week,
+  start_time: '09:00',
+  end_time: '17:00',
+  slot_duration_minutes: 15,
+})
+
+describe('useDoctorAvailability', () => {
+  beforeEach(() => {
+    vi.clearAllMocks()
+  })
+
+  describe('createAvailabilities', () => {
+    it('falls back to per-day inserts and keeps the days that succeed', async () => {
+      const { result } = renderHook(() => useDoctorAvailability('doc-123'))
+      await waitFor(() => expect(result.current.loading).toBe(false))
+
+      let created: Awaited<ReturnType<typeof result.current.createAvailabilities>> = null
+      await act(async () => {
+        created = await result.current.createAvailabilities([slot(1), slot(3), slot(5)])
+      })
+
+      expect(created).toHaveLength(2)
+      expect(result.current.availability.map(a => a.day_of_week)).toEqual([1, 5])
+      expect(result.current.error).toBe('Failed to create availability for Wednesday')
+    })
+  })
+})
@@ -8,11 +8,14 @@ interface UseDoctorAvailabilityReturn {
   loading: boolean;
   error: string | null;
   createAvailability: (input: CreateAvailabilityInput) => Promise<DoctorAvailability | null>;
+  createAvailabilities: (inputs: CreateAvailabilityInput[]) => Promise<DoctorAvailability[] | null>;
   updateAvailability: (id: string, input: UpdateAvailabilityInput) => Promise<DoctorAvailability | null>;
   deleteAvailability: (id: string) => Promise<boolean>;
   refreshAvailability: () => Promise<void>;
 }
 
+const DAY_NAMES = ['Sunday', 'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday'];
+
 export function useDoctorAvailability(doctorId?: string): UseDoctorAvailabilityReturn {
   const { doctorProfile } = useAuth();
   const [availability, setAvailability] = useState<DoctorAvailability[]>([]);
@@ -89,7 +92,10 @@ export function useDoctorAvailability(doctorId?: string): UseDoctorAvailabilityR
     fetchAvailability();
   }, [fetchAvailability]);
 
-  const createAvailability = async (input: CreateAvailabilityInput): Promise<DoctorAvailability | null> => {
+  // Insert several slots (e.g. one per selected weekday) in a single request.
+  // If that request fails, each slot is retried on its own so one bad day doesn't
+  // block the rest; returns whatever was created, or null if nothing was.
+  const createAvailabilities = async (inputs: CreateAvailabilityInput[]): Promise<DoctorAvailability[] | null> => {
     // Get fresh doctor ID at time of call
     console.log('🩺 createAvailability: doctorProfile at call time:', doctorProfile ? { id: doctorProfile.id, name: doctorProfile.name } : null);
     console.log('🩺 createAvailability: provided doctorId:', doctorId);
@@ -103,32 +109,60 @@ export function useDoctorAvailability(doctorId?: string): UseDoctorAvailabilityR
       return null;
     }
 
+    if (inputs.length === 0) return [];
+
     console.log('✅ Creating availability with doctor ID:', currentDoctorId);
 
+    const toRow = (input: CreateAvailabilityInput) => ({
+      doctor_id: currentDoctorId,
+      day_of_week: input.day_of_week,
+      start_time: input.start_time,
+      end_time: input.end_time,
+      slot_duration_minutes: input.slot_duration_minutes || 15,
+      is_active: true
+    });
+
     try {
       const { data, error: createError } = await supabase
         .from('doctor_availability')
-        .insert({
-          doctor_id: currentDoctorId,
-          day_of_week: input.day_of_week,
-          start_time: input.start_time,
-          end_time: input.end_time,
-          slot_duration_minutes: input.slot_duration_minutes || 15,
-          is_active: true
-        })
-        .select()
-        .single();
-
-      if (createError) throw createError;
+        .insert(inputs.map(toRow))
+        .select();
+
+      let created: DoctorAvailability[] = data || [];
+
+      if (createError) {
+        if (inputs.length === 1) throw createError;
+
+        console.warn('Bulk availability insert failed, retrying each day separately:', createError);
+        const results = await Promise.all(inputs.map(input =>
+          supabase.from('doctor_availability').insert(toRow(input)).select().single()
+        ));
+
+        created = [];
+        const failedDays: string[] = [];
+        results.forEach((result, i) => {
+          if (result.error || !result.data) {
+            console.error(`Error creating availability for ${DAY_NAMES[inputs[i].day_of_week]}:`, result.error);
+            failedDays.push(DAY_NAMES[inputs[i].day_of_week]);
+          } else {
+            created.push(result.data);
+          }
+        });
+
+        if (failedDays.length > 0) {
+          setError(`Failed to create availability for ${failedDays.join(', ')}`);
+        }
+        if (created.length === 0) return null;
+      }
 
-      console.log('✅ Availability created successfully:', data);
+      console.log(`✅ Availability created successfully: ${created.length} slot(s)`);
 
-      setAvailability(prev => [...prev, data].sort((a, b) => {
+      setAvailability(prev => [...prev, ...created].sort((a, b) => {
         if (a.day_of_week !== b.day_of_week) return a.day_of_week - b.day_of_week;
         return a.start_time.localeCompare(b.start_time);
       }));
 
-      return data;
+      return created;
     } catch (err) {
       console.error('Error creating availability:', err);
       setError(err instanceof Error ? err.message : 'Failed to create availability');
@@ -136,6 +170,11 @@ export function useDoctorAvailability(doctorId?: string): UseDoctorAvailabilityR
     }
   };
 
+  const createAvailability = async (input: CreateAvailabilityInput): Promise<DoctorAvailability | null> => {
+    const created = await createAvailabilities([input]);
+    return created?.[0] ?? null;
+  };
+
   const updateAvailability = async (id: string, input: UpdateAvailabilityInput): Promise<DoctorAvailability | null> => {
     try {
       const { data, error: updateError } = await supabase
@@ -182,6 +221,7 @@ export function useDoctorAvailability(doctorId?: string): UseDoctorAvailabilityR
     loading,
     error,
     createAvailability,
+    createAvailabilities,
     updateAvailability,
     deleteAvailability,
     refreshAvailability: fetchAvailability
@@ -1,4 +1,6 @@
 import { useState, useRef, useCallback } from 'react';
+import { encodePcm16Base64 } from '../utils/pcmEncoding';
+import { debugLog } from '../utils/logger';
 
 const API_URL = import.meta.env.VITE_API_URL || 'http://localhost:8000';
 const ELEVENLABS_WS_URL = 'wss://api.elevenlabs.io/v1/speech-to-text/realtime';
@@ -131,7 +133,7 @@ export function useElevenLabsTranscription(): UseElevenLabsTranscriptionReturn {
       ws.onmessage = (event) => {
         try {
           const data = JSON.parse(event.data);
-          console.log('📩 ElevenLabs message:', data.message_type, data);
+          debugLog('📩 ElevenLabs message:', data.message_type, data);
 
           switch (data.message_type) {
             case 'session_started':
@@ -219,18 +221,7 @@ export function useElevenLabsTranscription(): UseElevenLabsTranscriptionReturn {
       if (ws.readyState !== WebSocket.OPEN) return;
 
       const inputData = e.inputBuffer.getChannelData(0);
-
-      // Convert Float32Array to Int16Array (PCM 16-bit)
-      const int16Array = new Int16Array(inputData.length);
-      for (let i = 0; i < inputData.length; i++) {
-        const s = Math.max(-1, Math.min(1, inputData[i]));
-        int16Array[i] = s < 0 ? s * 0x8000 : s * 0x7FFF;
-      }
-
-      // Convert to base64
-      const audioBase64 = btoa(
-        String.fromCharCode(...new Uint8Array(int16Array.buffer))
-      );
+      const audioBase64 = encodePcm16Base64(inputData);
 
       // Send to ElevenLabs
       ws.send(JSON.stringify({
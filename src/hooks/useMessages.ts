@@ -76,25 +76,33 @@ export function useMessages(): UseMessagesReturn {
         }
       }
 
-      // Fetch names for all conversation partners
+      // Fetch names for all conversation partners - one batched query per party
+      // type, run concurrently, instead of a round trip per conversation
       const conversations = Array.from(conversationMap.values());
 
-      for (const conv of conversations) {
-        if (conv.other_party_type === 'doctor') {
-          const { data: doctor } = await supabase
-            .from('doctors')
-            .select('name')
-            .eq('id', conv.other_party_id)
-            .single();
-          conv.other_party_name = doctor?.name || 'Doctor';
-        } else {
-          const { data: patient } = await supabase
-            .from('patients')
-            .select('name')
-            .eq('id', conv.other_party_id)
-            .single();
-          conv.other_party_name = patient?.name || 'Patient';
+      const fetchNames = async (table: 'doctors' | 'patients', ids: string[]) => {
+        const names = new Map<string, string>();
+        if (ids.length === 0) return names;
+
+        const { data } = await supabase
+          .from(table)
+          .select('id, name')
+          .in('id', ids);
+        for (const row of data || []) {
+          names.set(row.id, row.name);
         }
+        return names;
+      };
+
+      const [doctorNames, patientNames] = await Promise.all([
+        fetchNames('doctors', conversations.filter(c => c.other_party_type === 'doctor').map(c => c.other_party_id)),
+        fetchNames('patients', conversations.filter(c => c.other_party_type !== 'doctor').map(c => c.other_party_id)),
+      ]);
+
+      for (const conv of conversations) {
+        conv.other_party_name = conv.other_party_type === 'doctor'
+          ? doctorNames.get(conv.other_party_id) || 'Doctor'
+          : patientNames.get(conv.other_party_id) || 'Patient';
       }
 
       // Sort by most recent message
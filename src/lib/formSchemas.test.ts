@@ -0,0 +1,61 @@
+/**
+ * Unit tests for the memoised form schema requests
+ */
+
+import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
+import { getFormSchema, getFormSchemas, invalidateFormSchemas, FormSchemaRequestError } from './formSchemas';
+
+const mockFetch = vi.fn();
+
+const jsonResponse = (body: unknown, status = 200) =>
+  ({ ok: status < 400, status, json: () => Promise.resolve(body) }) as unknown as Response;
+
+describe('form schema cache', () => {
+  beforeEach(() => {
+    invalidateFormSchemas();
+    mockFetch.mockReset();
+    vi.stubGlobal('fetch', mockFetch);
+  });
+
+  afterEach(() => {
+    vi.unstubAllGlobals();
+  });
+
+  it('shares one request between concurrent callers', async () => {
+    mockFetch.mockResolvedValue(jsonResponse({ schema: { vitals: {} } }));
+
+    const [a, b] = await Promise.all([getFormSchema('antenatal'), getFormSchema('antenatal')]);
+
+    expect(a).toBe(b);
+    expect(mockFetch).toHaveBeenCalledTimes(1);
+  });
+
+  it('keys the cache by form type', async () => {
+    mockFetch.mockResolvedValue(jsonResponse({ schema: {} }));
+
+    await getFormSchema('antenatal');
+    await getFormSchema('infertility');
+
+    expect(mockFetch).toHaveBeenCalledTimes(2);
+  });
+
+  it('reuses the schema list until invalidated', async () => {
+    mockFetch.mockResolvedValue(jsonResponse({ schemas: [] }));
+
+    await getFormSchemas();
+    await getFormSchemas();
+    expect(mockFetch).toHaveBeenCalledTimes(1);
+
+    invalidateFormSchemas();
+    await getFormSchemas();
+    expect(mockFetch).toHaveBeenCalledTimes(2);
+  });
+
+  it('surfaces the backend detail and does not cache failures', async () => {
+    mockFetch.mockResolvedValueOnce(jsonResponse({ detail: 'Form type not found' }, 404));
+    mockFetch.mockResolvedValueOnce(jsonResponse({ schema: {} }));
+
+    await expect(getFormSchema('unknown')).rejects.toThrow(FormSchemaRequestError);
+    await expect(getFormSchema('unknown')).resolves.toEqual({ schema: {} });
+  });
+});
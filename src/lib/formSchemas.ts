@@ -0,0 +1,79 @@
+/**
+ * Form schema requests
+ *
+ * Schemas are read-only for the lifetime of a consultation, but several
+ * components (InputScreen, ConsultationFormSelector, every MedicalForm) ask
+ * for them independently. Responses are memoised briefly and concurrent
+ * callers share one in-flight request.
+ */
+
+const API_URL = import.meta.env.VITE_API_URL || 'http://localhost:8000';
+
+// Short enough that edits made from another tab show up without a reload
+const SCHEMA_CACHE_TTL_MS = 5 * 60 * 1000;
+
+/**
+ * Raised when the backend answers with an error status.
+ * The message is the backend's `detail` when one is provided.
+ */
+export class FormSchemaRequestError extends Error {
+  constructor(message: string, public status: number) {
+    super(message);
+    this.name = 'FormSchemaRequestError';
+  }
+}
+
+interface CacheEntry {
+  promise: Promise<any>;
+  fetchedAt: number;
+}
+
+const cache = new Map<string, CacheEntry>();
+
+function cachedGet(path: string, fallbackError: string): Promise<any> {
+  const entry = cache.get(path);
+  if (entry && Date.now() - entry.fetchedAt < SCHEMA_CACHE_TTL_MS) {
+    return entry.promise;
+  }
+
+  const promise = (async () => {
+    const response = await fetch(`${API_URL}${path}`);
+    const data = await response.json().catch(() => ({}));
+    if (!response.ok) {
+      throw new FormSchemaRequestError(data.detail || fallbackError, response.status);
+    }
+    return data;
+  })();
+
+  // Store before awaiting so concurrent callers coalesce onto this request
+  cache.set(path, { promise, fetchedAt: Date.now() });
+  promise.catch(() => {
+    // Never cache failures - the next caller retries
+    if (cache.get(path)?.promise === promise) {
+      cache.delete(path);
+    }
+  });
+
+  return promise;
+}
+
+/**
+ * Fetch the schema for a single form type (`/api/form-schema/{formType}`)
+ */
+export function getFormSchema(formType: string): Promise<any> {
+  return cachedGet(`/api/form-schema/${formType}`, `Failed to load ${formType} form`);
+}
+
+/**
+ * Fetch all available form schemas (`/api/form-schemas`)
+ */
+export function getFormSchemas(): Promise<{ schemas: any[] }> {
+  return cachedGet('/api/form-schemas', 'Failed to fetch form schemas');
+}
+
+/**
+ * Drop cached schemas, e.g. after a custom form is created, edited or removed
+ */
+export function invalidateFormSchemas(): void {
+  cache.clear();
+}
@@ -0,0 +1,104 @@
+/**
+ * Unit tests for the shared IP lookup
+ */
+
+import { describe, it, expect, vi, beforeEach } from 'vitest';
+
+vi.mock('../utils/fetchWithTimeout', () => ({
+  fetchWithTimeout: vi.fn(),
+}));
+
+import { fetchWithTimeout } from '../utils/fetchWithTimeout';
+import { getUserIp, clearUserIpCache, isValidIp } from './geolocation';
+
+const mockFetch = vi.mocked(fetchWithTimeout);
+
+const ipResponse = (ip: string, ok = true) =>
+  ({ ok, status: ok ? 200 : 503, json: () => Promise.resolve({ ip }) }) as unknown as Response;
+
+describe('isValidIp', () => {
+  it('accepts IPv4 and IPv6 addresses', () => {
+    expect(isValidIp('81.2.69.160')).toBe(true);
+    expect(isValidIp('2001:db8::1')).toBe(true);
+  });
+
+  it('rejects malformed values', () => {
+    expect(isValidIp(undefined)).toBe(false);
+    expect(isValidIp('')).toBe(false);
+    expect(isValidIp('256.1.1.1')).toBe(false);
+    expect(isValidIp('<html>')).toBe(false);
+  });
+});
+
+describe('getUserIp', () => {
+  beforeEach(() => {
+    clearUserIpCache();
+    mockFetch.mockReset();
+  });
+
+  it('returns the detected IP', async () => {
+    mockFetch.mockResolvedValue(ipResponse('81.2.69.160'));
+
+    expect(await getUserIp()).toBe('81.2.69.160');
+  });
+
+  it('reuses the cached IP on subsequent calls', async () => {
+    mockFetch.mockResolvedValue(ipResponse('81.2.69.160'));
+
+    await getUserIp();
+    await getUserIp();
+
+    expect(mockFetch).toHaveBeenCalledTimes(1);
+  });
+
+  it('shares one request between concurrent callers', async () => {
+    mockFetch.mockResolvedValue(ipResponse('81.2.69.160'));
+
+    const results = await Promise.all([getUserIp(), getUserIp(), getUserIp()]);
+
+    expect(results).toEqual(['81.2.69.160', '81.2.69.160', '81.2.69.160']);
+    expect(mockFetch).toHaveBeenCalledTimes(1);
+  });
+
+  it('returns undefined and does not cache failures', async () => {
+    mockFetch.mockRejectedValueOnce(new Error('Request timeout after 3000ms'));
+    mockFetch.mockResolvedValueOnce(ipResponse('81.2.69.160'));
+
+    expect(await getUserIp()).toBeUndefined();
+    expect(await getUserIp()).toBe('81.2.69.160');
+  });
+
+  it('does not forward an invalid address', async () => {
+    mockFetch.mockResolvedValue(ipResponse('not-an-ip'));
+
+    expect(await getUserIp()).toBeUndefined();
+  });
+
+  it('treats an error status as a failed lookup', async () => {
+    mockFetch.mockResolvedValue(ipResponse('81.2.69.160', false));
+
+    expect(await getUserIp()).toBeUndefined();
+  });
+
+  it('looks the IP up again after the cache is cleared', async () => {
+    mockFetch.mockResolvedValueOnce(ipResponse('81.2.69.160'));
+    mockFetch.mockResolvedValueOnce(ipResponse('2001:db8::1'));
+
+    expect(await getUserIp()).toBe('81.2.69.160');
+    clearUserIpCache();
+    expect(await getUserIp()).toBe('2001:db8::1');
+  });
+
+  it('does not cache a lookup that was in flight when the cache was cleared', async () => {
+    let resolveLookup: (response: Response) => void = () => {};
+    mockFetch.mockReturnValueOnce(new Promise<Response>(resolve => { resolveLookup = resolve; }));
+    mockFetch.mockResolvedValueOnce(ipResponse('2001:db8::1'));
+
+    const staleLookup = getUserIp();
+    clearUserIpCache();
+    resolveLookup(ipResponse('81.2.69.160'));
+    await staleLookup;
+
+    expect(await getUserIp()).toBe('2001:db8::1');
+  });
+});
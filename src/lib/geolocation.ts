@@ -0,0 +1,85 @@
+/**
+ * Geolocation helpers
+ *
+ * Detects the user's public IP so the backend can pick regional guidelines.
+ * All analysis entry points share this module instead of each issuing their
+ * own ipify request.
+ */
+
+import { fetchWithTimeout } from '../utils/fetchWithTimeout';
+
+const IPIFY_URL = 'https://api.ipify.org?format=json';
+
+// ipify normally answers in well under a second - don't let it stall analysis
+const IP_LOOKUP_TIMEOUT_MS = 3000;
+
+// Public IPs rarely change mid-session; re-check occasionally for roaming devices
+const IP_CACHE_TTL_MS = 10 * 60 * 1000;
+
+const IPV4_PATTERN = /^(25[0-5]|2[0-4]\d|1?\d?\d)(\.(25[0-5]|2[0-4]\d|1?\d?\d)){3}$/;
+const IPV6_PATTERN = /^[0-9a-f:.]+$/i;
+
+let cachedIp: { ip: string; fetchedAt: number } | null = null;
+let inFlightLookup: Promise<string | undefined> | null = null;
+// Bumped by clearUserIpCache so a lookup started before a clear can't repopulate the cache
+let cacheGeneration = 0;
+
+/**
+ * Cheap shape check so a malformed lookup result (error page, proxy rewrite)
+ * is never cached or forwarded to the backend's geolocation
+ */
+export function isValidIp(value: unknown): value is string {
+  if (typeof value !== 'string') return false;
+  if (IPV4_PATTERN.test(value)) return true;
+  return value.includes(':') && value.length <= 45 && IPV6_PATTERN.test(value);
+}
+
+async function lookupUserIp(): Promise<string | undefined> {
+  const generation = cacheGeneration;
+  try {
+    const response = await fetchWithTimeout(IPIFY_URL, {}, IP_LOOKUP_TIMEOUT_MS);
+    if (!response.ok) {
+      throw new Error(`IP lookup failed: ${response.status}`);
+    }
+    const data = await response.json();
+    if (!isValidIp(data.ip)) {
+      throw new Error(`IP lookup returned an invalid address: ${String(data.ip)}`);
+    }
+    if (generation === cacheGeneration) {
+      cachedIp = { ip: data.ip, fetchedAt: Date.now() };
+    }
+    return data.ip;
+  } catch (error) {
+    console.warn('Could not detect IP address, backend will auto-detect:', error);
+    return undefined;
+  }
+}
+
+/**
+ * Get the user's public IP address.
+ * Results are cached for IP_CACHE_TTL_MS and concurrent callers share one request.
+ * Returns undefined on failure so the backend can fall back to auto-detection.
+ */
+export async function getUserIp(): Promise<string | undefined> {
+  if (cachedIp && Date.now() - cachedIp.fetchedAt < IP_CACHE_TTL_MS) {
+    return cachedIp.ip;
+  }
+
+  if (!inFlightLookup) {
+    const lookup = lookupUserIp().finally(() => {
+      if (inFlightLookup === lookup) inFlightLookup = null;
+    });
+    inFlightLookup = lookup;
+  }
+  return inFlightLookup;
+}
+
+/**
+ * Forget the cached IP. Called on sign-out so the next user on this device
+ * gets a fresh lookup.
+ */
+export function clearUserIpCache(): void {
+  cachedIp = null;
+  inFlightLookup = null;
+  cacheGeneration++;
+}
@@ -25,6 +25,21 @@ if (import.meta.env.VITE_POSTHOG_KEY) {
   });
 }
 
+// Open connections to the backend and IP lookup service early, so the first
+// analysis doesn't pay DNS + TCP + TLS setup on its critical path.
+// crossOrigin matches the anonymous CORS fetches that will reuse the socket.
+for (const url of [import.meta.env.VITE_API_URL || 'http://localhost:8000', 'https://api.ipify.org']) {
+  try {
+    const link = document.createElement('link');
+    link.rel = 'preconnect';
+    link.href = new URL(url).origin;
+    link.crossOrigin = 'anonymous';
+    document.head.appendChild(link);
+  } catch {
+    // Invalid URL - App reports API_URL configuration errors itself
+  }
+}
+
 ReactDOM.createRoot(document.getElementById('root')!).render(
   <React.StrictMode>
     <App />
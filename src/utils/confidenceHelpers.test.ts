@@ -0,0 +1,20 @@
+/**
+ * Unit tests for confidence helpers
+ */
+
+import { describe, it, expect } from 'vitest';
+import { getConfidenceBadgeColor } from './confidenceHelpers';
+
+describe('getConfidenceBadgeColor', () => {
+  it('maps each confidence level regardless of case', () => {
+    expect(getConfidenceBadgeColor('high')).toBe('bg-green-100 text-green-700 border-green-300');
+    expect(getConfidenceBadgeColor('Medium')).toBe('bg-yellow-100 text-yellow-700 border-yellow-300');
+    expect(getConfidenceBadgeColor('LOW')).toBe('bg-red-100 text-red-700 border-red-300');
+  });
+
+  it('falls back to neutral colours for missing or unknown values', () => {
+    expect(getConfidenceBadgeColor(undefined)).toBe('bg-gray-100 text-gray-700 border-gray-300');
+    expect(getConfidenceBadgeColor(null)).toBe('bg-gray-100 text-gray-700 border-gray-300');
+    expect(getConfidenceBadgeColor('certain')).toBe('bg-gray-100 text-gray-700 border-gray-300');
+  });
+});
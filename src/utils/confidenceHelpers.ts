@@ -0,0 +1,21 @@
+/**
+ * Confidence Helper Functions
+ */
+
+const CONFIDENCE_BADGE_COLORS: Record<string, string> = {
+  high: 'bg-green-100 text-green-700 border-green-300',
+  medium: 'bg-yellow-100 text-yellow-700 border-yellow-300',
+  low: 'bg-red-100 text-red-700 border-red-300',
+};
+
+const DEFAULT_CONFIDENCE_BADGE_COLOR = 'bg-gray-100 text-gray-700 border-gray-300';
+
+/**
+ * Gets the badge classes for a diagnosis confidence level
+ *
+ * @param confidence - The diagnosis confidence ('high', 'medium' or 'low', any case)
+ * @returns Tailwind background, text and border classes for the badge
+ */
+export function getConfidenceBadgeColor(confidence?: string | null): string {
+  return (confidence && CONFIDENCE_BADGE_COLORS[confidence.toLowerCase()]) || DEFAULT_CONFIDENCE_BADGE_COLOR;
+}
@@ -15,6 +15,11 @@ interface FieldDefinition {
   required?: boolean;
 }
 
+/**
+ * Top-level schema keys that describe the form rather than a section
+ */
+export const SCHEMA_METADATA_KEYS: ReadonlySet<string> = new Set(['title', 'description', 'version', 'type']);
+
 interface SectionDefinition {
   description?: string;
   fields?: FieldDefinition[] | Record<string, any>;
@@ -178,16 +183,13 @@ function generateObjectSampleData(field: FieldDefinition): string {
 export function generateSampleFormData(formSchema: FormSchema): SampleFormData {
   const sampleData: SampleFormData = {};
 
-  // Metadata keys to skip
-  const metadataKeys = new Set(['title', 'description', 'version', 'type']);
-
   for (const [sectionName, sectionConfig] of Object.entries(formSchema)) {
     if (!sectionConfig || typeof sectionConfig !== 'object') {
       continue;
     }
 
     // Skip metadata sections
-    if (metadataKeys.has(sectionName)) {
+    if (SCHEMA_METADATA_KEYS.has(sectionName)) {
       continue;
     }
 
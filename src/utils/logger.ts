@@ -0,0 +1,17 @@
+/**
+ * Development-only logging
+ *
+ * Use for high-volume diagnostics (e.g. one line per SSE event). In production
+ * builds these calls are no-ops, so the browser doesn't format the messages or
+ * retain references to large payloads in the console buffer.
+ *
+ * Warnings and errors should keep using console.warn / console.error directly.
+ */
+
+const DEBUG_ENABLED = import.meta.env.DEV;
+
+export function debugLog(...args: unknown[]): void {
+  if (DEBUG_ENABLED) {
+    console.log(...args);
+  }
+}
@@ -0,0 +1,39 @@
+/**
+ * Unit tests for PCM encoding of microphone samples
+ */
+
+import { describe, it, expect } from 'vitest';
+import { float32ToInt16, bytesToBase64, encodePcm16Base64 } from './pcmEncoding';
+
+describe('float32ToInt16', () => {
+  it('scales and clamps samples to the 16-bit range', () => {
+    const pcm = float32ToInt16(new Float32Array([0, 1, -1, 2, -2]));
+
+    expect(Array.from(pcm)).toEqual([0, 32767, -32768, 32767, -32768]);
+  });
+});
+
+describe('bytesToBase64', () => {
+  it('matches btoa for small inputs', () => {
+    const bytes = new Uint8Array([0, 1, 2, 253, 254, 255]);
+
+    expect(bytesToBase64(bytes)).toBe(btoa(String.fromCharCode(0, 1, 2, 253, 254, 255)));
+  });
+
+  it('encodes inputs larger than one chunk', () => {
+    const bytes = new Uint8Array(0x8000 * 2 + 3).map((_, i) => i % 256);
+
+    const decoded = atob(bytesToBase64(bytes));
+
+    expect(decoded.length).toBe(bytes.length);
+    expect(decoded.charCodeAt(0x8000 + 1)).toBe(bytes[0x8000 + 1]);
+  });
+});
+
+describe('encodePcm16Base64', () => {
+  it('produces two bytes per sample', () => {
+    const encoded = encodePcm16Base64(new Float32Array(4096));
+
+    expect(atob(encoded).length).toBe(8192);
+  });
+});
@@ -0,0 +1,47 @@
+/**
+ * PCM Encoding Utilities
+ *
+ * Converts microphone samples into the base64 16-bit PCM payloads expected by
+ * the streaming transcription APIs. This runs inside onaudioprocess on the
+ * main thread several times a second, so it avoids building intermediate
+ * arrays.
+ */
+
+// String.fromCharCode.apply is limited by the engine's max argument count
+const CHARCODE_CHUNK_SIZE = 0x8000;
+
+/**
+ * Convert Float32Array audio samples to 16-bit PCM
+ */
+export function float32ToInt16(float32Array: Float32Array): Int16Array {
+  const int16Array = new Int16Array(float32Array.length);
+  for (let i = 0; i < float32Array.length; i++) {
+    const s = Math.max(-1, Math.min(1, float32Array[i]));
+    int16Array[i] = s < 0 ? s * 0x8000 : s * 0x7fff;
+  }
+  return int16Array;
+}
+
+/**
+ * Base64-encode raw bytes.
+ * Uses apply() on typed-array slices rather than spreading, which would
+ * materialise an intermediate array of every byte.
+ */
+export function bytesToBase64(bytes: Uint8Array): string {
+  let binary = '';
+  for (let i = 0; i < bytes.length; i += CHARCODE_CHUNK_SIZE) {
+    binary += String.fromCharCode.apply(
+      null,
+      bytes.subarray(i, i + CHARCODE_CHUNK_SIZE) as unknown as number[]
+    );
+  }
+  return btoa(binary);
+}
+
+/**
+ * Convert Float32Array audio samples to base64-encoded 16-bit PCM
+ */
+export function encodePcm16Base64(samples: Float32Array): string {
+  const pcm = float32ToInt16(samples);
+  return bytesToBase64(new Uint8Array(pcm.buffer));
+}
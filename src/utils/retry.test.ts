@@ -0,0 +1,74 @@
+/**
+ * Unit tests for fetchWithRetry
+ */
+
+import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
+import { fetchWithRetry } from './retry';
+
+const mockFetch = vi.fn();
+
+const statusResponse = (status: number, headers: Record<string, string> = {}) =>
+  ({ ok: status < 400, status, headers: new Headers(headers) }) as unknown as Response;
+
+const noDelay = { initialDelayMs: 0, maxDelayMs: 0 };
+
+describe('fetchWithRetry', () => {
+  beforeEach(() => {
+    mockFetch.mockReset();
+    vi.stubGlobal('fetch', mockFetch);
+    vi.spyOn(console, 'warn').mockImplementation(() => {});
+  });
+
+  afterEach(() => {
+    vi.unstubAllGlobals();
+    vi.restoreAllMocks();
+  });
+
+  it('retries transient statuses until the request succeeds', async () => {
+    mockFetch
+      .mockResolvedValueOnce(statusResponse(503))
+      .mockResolvedValueOnce(statusResponse(429, { 'Retry-After': '0' }))
+      .mockResolvedValueOnce(statusResponse(200));
+
+    const response = await fetchWithRetry('/api/summarize', undefined, noDelay);
+
+    expect(response.status).toBe(200);
+    expect(mockFetch).toHaveBeenCalledTimes(3);
+  });
+
+  it('returns other errors without retrying', async () => {
+    mockFetch.mockResolvedValue(statusResponse(400));
+
+    const response = await fetchWithRetry('/api/summarize', undefined, noDelay);
+
+    expect(response.status).toBe(400);
+    expect(mockFetch).toHaveBeenCalledTimes(1);
+  });
+
+  it('returns the last response once attempts run out', async () => {
+    mockFetch.mockResolvedValue(statusResponse(502));
+
+    const response = await fetchWithRetry('/api/summarize', undefined, { ...noDelay, maxAttempts: 2 });
+
+    expect(response.status).toBe(502);
+    expect(mockFetch).toHaveBeenCalledTimes(2);
+  });
+
+  it('retries network failures', async () => {
+    mockFetch
+      .mockRejectedValueOnce(new TypeError('Failed to fetch'))
+      .mockResolvedValueOnce(statusResponse(200));
+
+    const response = await fetchWithRetry('/api/translate', undefined, noDelay);
+
+    expect(response.status).toBe(200);
+  });
+
+  it('does not retry aborted requests', async () => {
+    const abort = new DOMException('The operation was aborted.', 'AbortError');
+    mockFetch.mockRejectedValue(abort);
+
+    await expect(fetchWithRetry('/api/translate', undefined, noDelay)).rejects.toBe(abort);
+    expect(mockFetch).toHaveBeenCalledTimes(1);
+  });
+});
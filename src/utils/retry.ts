@@ -81,3 +81,58 @@ export async function withSupabaseRetry<T>(
 
   return { data: null as T, error: lastError };
 }
+
+// Transient statuses worth retrying: rate limiting and gateway/overload errors
+const RETRYABLE_STATUSES = new Set([429, 502, 503, 504]);
+
+/**
+ * fetch() with retry and exponential backoff.
+ *
+ * Retries network failures and transient HTTP statuses (429, 502, 503, 504),
+ * honouring a Retry-After header in seconds (capped at maxDelayMs). Any other
+ * response - including other errors - is returned to the caller unchanged,
+ * as is the last response once attempts run out.
+ *
+ * Only use for requests that are safe to repeat.
+ */
+export async function fetchWithRetry(
+  input: RequestInfo | URL,
+  init?: RequestInit,
+  options: Omit<RetryOptions, 'shouldRetry'> = {}
+): Promise<Response> {
+  const config = { ...DEFAULT_OPTIONS, ...options };
+  let delay = config.initialDelayMs;
+
+  for (let attempt = 1; ; attempt++) {
+    let response: Response;
+    try {
+      response = await fetch(input, init);
+    } catch (error) {
+      const aborted = (error as { name?: string })?.name === 'AbortError';
+      if (aborted || attempt >= config.maxAttempts) throw error;
+
+      console.warn(
+        `Request failed (attempt ${attempt}/${config.maxAttempts}), retrying in ${delay}ms...`,
+        error
+      );
+      await sleep(delay);
+      delay = Math.min(delay * config.backoffMultiplier, config.maxDelayMs);
+      continue;
+    }
+
+    if (!RETRYABLE_STATUSES.has(response.status) || attempt >= config.maxAttempts) {
+      return response;
+    }
+
+    const retryAfterSeconds = Number(response.headers.get('Retry-After'));
+    const wait = Number.isFinite(retryAfterSeconds) && retryAfterSeconds > 0
+      ? Math.min(retryAfterSeconds * 1000, config.maxDelayMs)
+      : delay;
+
+    console.warn(
+      `Request returned ${response.status} (attempt ${attempt}/${config.maxAttempts}), retrying in ${wait}ms...`
+    );
+    await sleep(wait);
+    delay = Math.min(delay * config.backoffMultiplier, config.maxDelayMs);
+  }
+}
@@ -0,0 +1,20 @@
+/**
+ * Unit tests for text helpers
+ */
+
+import { describe, it, expect } from 'vitest';
+import { truncateText } from './textHelpers';
+
+describe('truncateText', () => {
+  it('returns short text unchanged', () => {
+    expect(truncateText('Headache for 3 days', 100)).toBe('Headache for 3 days');
+  });
+
+  it('keeps text that is exactly the limit', () => {
+    expect(truncateText('abcde', 5)).toBe('abcde');
+  });
+
+  it('cuts long text and appends an ellipsis', () => {
+    expect(truncateText('abcdefgh', 5)).toBe('abcde...');
+  });
+});
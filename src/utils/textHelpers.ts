@@ -0,0 +1,15 @@
+/**
+ * Text Helper Functions
+ */
+
+/**
+ * Truncates text to `maxLength` characters, appending an ellipsis when cut.
+ * Text that already fits is returned as-is.
+ *
+ * @param text - The text to shorten
+ * @param maxLength - Maximum number of characters to keep before the ellipsis
+ * @returns The original text, or its first `maxLength` characters followed by '...'
+ */
+export function truncateText(text: string, maxLength: number): string {
+  return text.length > maxLength ? text.substring(0, maxLength) + '...' : text;
+}
@@ -0,0 +1,35 @@
+/**
+ * Unit tests for the live transcript buffer
+ */
+
+import { describe, it, expect } from 'vitest';
+import { TranscriptBuffer } from './transcriptBuffer';
+
+describe('TranscriptBuffer', () => {
+  it('joins turns with single spaces', () => {
+    const buffer = new TranscriptBuffer();
+    buffer.push('Good morning.');
+    buffer.push('How are you feeling?');
+
+    expect(buffer.text).toBe('Good morning. How are you feeling?');
+    expect(buffer.length).toBe(2);
+  });
+
+  it('matches Array.join for empty turns', () => {
+    const turns = ['', 'cough', '', 'fever'];
+    const buffer = new TranscriptBuffer();
+    turns.forEach(turn => buffer.push(turn));
+
+    expect(buffer.text).toBe(turns.join(' '));
+  });
+
+  it('starts again after clear', () => {
+    const buffer = new TranscriptBuffer();
+    buffer.push('previous recording');
+    buffer.clear();
+    buffer.push('new recording');
+
+    expect(buffer.text).toBe('new recording');
+    expect(buffer.length).toBe(1);
+  });
+});
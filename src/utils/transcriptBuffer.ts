@@ -0,0 +1,37 @@
+/**
+ * Transcript Buffer
+ *
+ * Accumulates completed transcription turns for live recording. Streaming
+ * providers send several partial transcripts per second, and each one needs
+ * the full text so far; keeping the joined text up to date on push avoids
+ * re-joining every completed turn on every partial.
+ */
+
+export class TranscriptBuffer {
+  private turnCount = 0;
+  private joined = '';
+
+  /**
+   * Append a completed turn (space-separated, like `turns.join(' ')`)
+   */
+  push(turn: string): void {
+    this.joined = this.turnCount === 0 ? turn : `${this.joined} ${turn}`;
+    this.turnCount++;
+  }
+
+  /**
+   * All completed turns joined with single spaces
+   */
+  get text(): string {
+    return this.joined;
+  }
+
+  get length(): number {
+    return this.turnCount;
+  }
+
+  clear(): void {
+    this.turnCount = 0;
+    this.joined = '';
+  }
+}
@@ -0,0 +1,62 @@
+/**
+ * Unit tests for UpdateBatcher
+ */
+
+import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
+import { UpdateBatcher } from './updateBatcher';
+
+describe('UpdateBatcher', () => {
+  beforeEach(() => {
+    vi.useFakeTimers();
+  });
+
+  afterEach(() => {
+    vi.useRealTimers();
+  });
+
+  it('delivers items pushed within one interval as a single batch', () => {
+    const onFlush = vi.fn();
+    const batcher = new UpdateBatcher<number>(onFlush, 50);
+
+    batcher.push(1);
+    batcher.push(2);
+    batcher.push(3);
+    expect(onFlush).not.toHaveBeenCalled();
+
+    vi.advanceTimersByTime(50);
+    expect(onFlush).toHaveBeenCalledTimes(1);
+    expect(onFlush).toHaveBeenCalledWith([1, 2, 3]);
+  });
+
+  it('starts a new batch after each flush', () => {
+    const onFlush = vi.fn();
+    const batcher = new UpdateBatcher<string>(onFlush, 50);
+
+    batcher.push('a');
+    vi.advanceTimersByTime(50);
+    batcher.push('b');
+    vi.advanceTimersByTime(50);
+
+    expect(onFlush.mock.calls).toEqual([[['a']], [['b']]]);
+  });
+
+  it('flushes pending items immediately on demand', () => {
+    const onFlush = vi.fn();
+    const batcher = new UpdateBatcher<number>(onFlush, 50);
+
+    batcher.push(1);
+    batcher.flush();
+    expect(onFlush).toHaveBeenCalledWith([1]);
+
+    // The cancelled timer must not deliver an empty batch later
+    vi.advanceTimersByTime(50);
+    expect(onFlush).toHaveBeenCalledTimes(1);
+  });
+
+  it('does nothing when flushed with no pending items', () => {
+    const onFlush = vi.fn();
+    new UpdateBatcher<number>(onFlush).flush();
+
+    expect(onFlush).not.toHaveBeenCalled();
+  });
+});
@@ -0,0 +1,46 @@
+/**
+ * Update Batcher
+ *
+ * Collects items that arrive in quick succession and hands them over in
+ * batches, at most once per interval. Used to throttle React state updates
+ * driven by high-frequency streams (e.g. SSE events), so the UI re-renders
+ * once per batch instead of once per message.
+ */
+
+// Roughly three frames - fast enough to feel live, slow enough to coalesce bursts
+const DEFAULT_FLUSH_INTERVAL_MS = 50;
+
+export class UpdateBatcher<T> {
+  private pending: T[] = [];
+  private timer: ReturnType<typeof setTimeout> | null = null;
+
+  constructor(
+    private readonly onFlush: (items: T[]) => void,
+    private readonly intervalMs = DEFAULT_FLUSH_INTERVAL_MS
+  ) {}
+
+  /**
+   * Queue an item; it is delivered with the next scheduled flush
+   */
+  push(item: T): void {
+    this.pending.push(item);
+    if (this.timer === null) {
+      this.timer = setTimeout(() => this.flush(), this.intervalMs);
+    }
+  }
+
+  /**
+   * Deliver everything queued so far immediately (e.g. when the stream ends)
+   */
+  flush(): void {
+    if (this.timer !== null) {
+      clearTimeout(this.timer);
+      this.timer = null;
+    }
+    if (this.pending.length === 0) return;
+
+    const items = this.pending;
+    this.pending = [];
+    this.onFlush(items);
+  }
+}